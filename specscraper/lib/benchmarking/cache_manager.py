@@ -15,6 +15,9 @@ logger = logging.getLogger(__name__)
 class CacheManager:
     """Manages cached HTML content for benchmarking"""
     
+    # Max URLs per "IN (...)" query (SQLite's default variable limit is 999)
+    SQLITE_BATCH_SIZE = 500
+    
     def __init__(self, cache_dir: str = "shared/cache", llm_results_path: str = "shared/data/reference_data/llm_results.csv"):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True, parents=True)
@@ -291,40 +294,62 @@ class CacheManager:
             """, (datetime.now(), url))
             conn.commit()
     
+    def _update_access_stats_batch(self, urls: List[str]):
+        """Update access statistics for many cache entries in one transaction"""
+        if not urls:
+            return
+        now = datetime.now()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany("""
+                UPDATE cache_entries 
+                SET last_accessed = ?, access_count = access_count + 1
+                WHERE url = ?
+            """, [(now, url) for url in urls])
+            conn.commit()
+    
     def get_batch_cached_html(self, urls: List[str]) -> Dict[str, Optional[str]]:
         """Get cached HTML for multiple URLs efficiently"""
         results = {}
+        accessed = []
+        remaining_urls = []
         
         # Check memory cache first
-        for url in urls:
+        for url in dict.fromkeys(urls):
             if url in self._memory_cache:
                 results[url] = self._memory_cache[url]
-                self._update_access_stats(url)
+                accessed.append(url)
+            else:
+                remaining_urls.append(url)
         
-        # Get remaining from disk
-        remaining_urls = [url for url in urls if url not in results]
+        # Get remaining from disk, chunked to stay under SQLite's variable limit
         if remaining_urls:
             with sqlite3.connect(self.db_path) as conn:
-                placeholders = ','.join('?' * len(remaining_urls))
-                cursor = conn.execute(f"""
-                    SELECT url, file_path 
-                    FROM cache_entries 
-                    WHERE url IN ({placeholders})
-                """, remaining_urls)
-                
-                for url, file_path in cursor.fetchall():
-                    try:
-                        content = Path(file_path).read_text(encoding='utf-8')
-                        results[url] = content
-                        self._memory_cache[url] = content
-                        self._update_access_stats(url)
-                    except Exception as e:
-                        logger.error(f"Error reading cached file for {url}: {e}")
-                        results[url] = None
+                rows = []
+                for start in range(0, len(remaining_urls), self.SQLITE_BATCH_SIZE):
+                    chunk = remaining_urls[start:start + self.SQLITE_BATCH_SIZE]
+                    placeholders = ','.join('?' * len(chunk))
+                    rows.extend(conn.execute(f"""
+                        SELECT url, file_path 
+                        FROM cache_entries 
+                        WHERE url IN ({placeholders})
+                    """, chunk).fetchall())
+            
+            for url, file_path in rows:
+                try:
+                    content = Path(file_path).read_text(encoding='utf-8')
+                    results[url] = content
+                    self._memory_cache[url] = content
+                    accessed.append(url)
+                except Exception as e:
+                    logger.error(f"Error reading cached file for {url}: {e}")
+                    results[url] = None
+        
+        # One transaction for all access-stat updates
+        self._update_access_stats_batch(accessed)
         
         # Set None for URLs not in cache
         for url in urls:
             if url not in results:
                 results[url] = None
                 
-        return results
\ No newline at end of file
+        return results
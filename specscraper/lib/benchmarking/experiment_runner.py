@@ -1,10 +1,10 @@
 """Experiment runner for benchmarking different LLM models and prompts"""
-import json
 import logging
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional
+import numpy as np
 import pandas as pd
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -18,11 +18,15 @@ from ..monitoring.models import PipelineStage
 from .cache_manager import CacheManager
 from .models import (
     ExperimentConfig, ExperimentResult, ExperimentSummary,
-    QualityMetrics, ModelProvider
+    QualityMetrics, ModelProvider, dump_summary
 )
 
 logger = logging.getLogger(__name__)
 
+# Quality score distribution buckets and their inner upper edges
+_QUALITY_BIN_LABELS = ("0.0-0.2", "0.2-0.4", "0.4-0.6", "0.6-0.8", "0.8-1.0")
+_QUALITY_BIN_EDGES = np.array([0.2, 0.4, 0.6, 0.8])
+
 
 class ExperimentRunner:
     """Runs experiments to compare different models and prompts"""
@@ -278,26 +282,13 @@ class ExperimentRunner:
         quality_scores = [r.quality_metrics.overall_score for r in successful]
         avg_quality = sum(quality_scores) / len(quality_scores) if quality_scores else 0
         
-        # Quality distribution
-        score_distribution = {
-            "0.0-0.2": 0,
-            "0.2-0.4": 0,
-            "0.4-0.6": 0,
-            "0.6-0.8": 0,
-            "0.8-1.0": 0
-        }
-        
-        for score in quality_scores:
-            if score <= 0.2:
-                score_distribution["0.0-0.2"] += 1
-            elif score <= 0.4:
-                score_distribution["0.2-0.4"] += 1
-            elif score <= 0.6:
-                score_distribution["0.4-0.6"] += 1
-            elif score <= 0.8:
-                score_distribution["0.6-0.8"] += 1
-            else:
-                score_distribution["0.8-1.0"] += 1
+        # Quality distribution: bins are closed on the right (0.2 counts as "0.0-0.2")
+        scores = np.fromiter(quality_scores, dtype=np.float64, count=len(quality_scores))
+        bin_counts = np.bincount(
+            np.searchsorted(_QUALITY_BIN_EDGES, scores, side='left'),
+            minlength=len(_QUALITY_BIN_LABELS)
+        )
+        score_distribution = dict(zip(_QUALITY_BIN_LABELS, bin_counts.tolist()))
         
         # Common issues
         all_issues = []
@@ -339,10 +330,7 @@ class ExperimentRunner:
         
         # Save summary
         summary_file = output_dir / f"{summary.config.experiment_id}_summary.json"
-        with open(summary_file, 'w') as f:
-            # Convert to dict and handle datetime serialization
-            summary_dict = summary.model_dump(mode='json')
-            json.dump(summary_dict, f, indent=2, default=str)
+        summary_file.write_bytes(dump_summary(summary))
         
         # Save detailed results as CSV
         results_data = []
@@ -1,9 +1,17 @@
 """Benchmarking data structures for experiment tracking"""
-from pydantic import BaseModel, Field
+import json
+from dataclasses import dataclass, field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from enum import Enum
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class ModelProvider(str, Enum):
     """Supported model providers"""
@@ -12,7 +20,13 @@ class ModelProvider(str, Enum):
 
 
 class ExperimentConfig(BaseModel):
-    """Configuration for a benchmarking experiment"""
+    """
+    Configuration for a benchmarking experiment
+    
+    Frozen so a config can key dicts and lru_cache'd functions directly.
+    """
+    model_config = ConfigDict(frozen=True)
+    
     experiment_id: str = Field(description="Unique identifier for the experiment")
     model_name: str = Field(description="Name of the model (e.g., gpt-4o-mini)")
     model_provider: ModelProvider = Field(default=ModelProvider.OPENAI)
@@ -22,42 +36,152 @@ class ExperimentConfig(BaseModel):
     prompt_version: str = Field(default="v1", description="Version of the prompt template")
     created_at: datetime = Field(default_factory=datetime.now)
     additional_params: Dict[str, Any] = Field(default_factory=dict)
+    
+    def __hash__(self) -> int:
+        # additional_params is a dict, so hash the scalar fields only;
+        # equality still compares every field
+        return hash((
+            self.experiment_id, self.model_name, self.model_provider,
+            self.temperature, self.max_tokens, self.prompt_template,
+            self.prompt_version, self.created_at
+        ))
 
 
-class QualityMetrics(BaseModel):
-    """Quality metrics from product extraction evaluation"""
-    overall_score: float = Field(description="Overall quality score (0-1)")
-    field_scores: Dict[str, float] = Field(description="Individual field quality scores")
-    json_parseable: bool = Field(description="Whether the output was valid JSON")
-    required_fields_present: bool = Field(description="Whether all required fields were present")
-    url_valid: bool = Field(description="Whether extracted URLs were valid")
-    issues: List[str] = Field(default_factory=list, description="List of quality issues")
+@dataclass(slots=True)
+class QualityMetrics:
+    """
+    Quality metrics from product extraction evaluation
+    
+    Plain slotted dataclass rather than a Pydantic model: one is built per
+    processed URL, so construction skips validation.
+    
+    Attributes:
+        overall_score: Overall quality score (0-1)
+        field_scores: Individual field quality scores
+        json_parseable: Whether the output was valid JSON
+        required_fields_present: Whether all required fields were present
+        url_valid: Whether extracted URLs were valid
+        issues: List of quality issues
+    """
+    overall_score: float
+    field_scores: Dict[str, float]
+    json_parseable: bool
+    required_fields_present: bool
+    url_valid: bool
+    issues: List[str] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict"""
+        return {
+            "overall_score": self.overall_score,
+            "field_scores": dict(self.field_scores),
+            "json_parseable": self.json_parseable,
+            "required_fields_present": self.required_fields_present,
+            "url_valid": self.url_valid,
+            "issues": list(self.issues),
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QualityMetrics":
+        """Create from a dict produced by to_dict"""
+        return cls(**data)
+    
+    # Pydantic-style aliases so existing call sites keep working
+    model_dump = to_dict
+    model_validate = from_dict
 
 
-class ExperimentResult(BaseModel):
-    """Results from a single experiment run"""
-    config: ExperimentConfig = Field(description="Configuration used for this experiment")
-    url: str = Field(description="URL that was processed")
-    execution_time: float = Field(description="Time taken to process in seconds")
+@dataclass(slots=True)
+class ExperimentResult:
+    """
+    Results from a single experiment run
+    
+    Plain slotted dataclass for the same reason as QualityMetrics; the
+    config is still a validated ExperimentConfig.
+    
+    Attributes:
+        config: Configuration used for this experiment
+        url: URL that was processed
+        execution_time: Time taken to process in seconds
+        prompt_tokens: Number of tokens in the prompt
+        completion_tokens: Number of tokens in the completion
+        total_tokens: Total tokens used
+        cost_usd: Cost in USD
+        quality_metrics: Quality evaluation results
+        extraction_successful: Whether extraction succeeded
+        prompt: The actual prompt sent to the model
+        raw_response: Raw response from the model
+        extracted_data: Extracted product data
+        error_message: Error message if failed
+        timestamp: When the result was created
+    """
+    config: ExperimentConfig
+    url: str
+    execution_time: float
     
     # Cost metrics
-    prompt_tokens: int = Field(description="Number of tokens in the prompt")
-    completion_tokens: int = Field(description="Number of tokens in the completion")
-    total_tokens: int = Field(description="Total tokens used")
-    cost_usd: float = Field(description="Cost in USD")
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+    cost_usd: float
     
     # Quality metrics
-    quality_metrics: QualityMetrics = Field(description="Quality evaluation results")
-    extraction_successful: bool = Field(description="Whether extraction succeeded")
+    quality_metrics: QualityMetrics
+    extraction_successful: bool
     
     # Raw data
-    prompt: str = Field(description="The actual prompt sent to the model")
-    raw_response: str = Field(description="Raw response from the model")
-    extracted_data: Dict[str, Any] = Field(description="Extracted product data")
+    prompt: str
+    raw_response: str
+    extracted_data: Dict[str, Any]
     
     # Error tracking
-    error_message: Optional[str] = Field(default=None, description="Error message if failed")
-    timestamp: datetime = Field(default_factory=datetime.now)
+    error_message: Optional[str] = None
+    timestamp: datetime = field(default_factory=datetime.now)
+    
+    def to_dict(self, mode: str = "python") -> Dict[str, Any]:
+        """
+        Convert to a plain dict
+        
+        With mode='json' the nested config and timestamp are rendered as
+        JSON-compatible values, matching Pydantic's model_dump(mode='json').
+        """
+        return {
+            "config": self.config.model_dump(mode=mode),
+            "url": self.url,
+            "execution_time": self.execution_time,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "cost_usd": self.cost_usd,
+            "quality_metrics": self.quality_metrics.to_dict(),
+            "extraction_successful": self.extraction_successful,
+            "prompt": self.prompt,
+            "raw_response": self.raw_response,
+            "extracted_data": dict(self.extracted_data),
+            "error_message": self.error_message,
+            "timestamp": self.timestamp.isoformat() if mode == "json" else self.timestamp,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ExperimentResult":
+        """Create from a dict produced by to_dict"""
+        data = dict(data)
+        config = data.pop("config")
+        quality_metrics = data.pop("quality_metrics")
+        if isinstance(data.get("timestamp"), str):
+            data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+        return cls(
+            config=config if isinstance(config, ExperimentConfig) else ExperimentConfig.model_validate(config),
+            quality_metrics=(
+                quality_metrics if isinstance(quality_metrics, QualityMetrics)
+                else QualityMetrics.from_dict(quality_metrics)
+            ),
+            **data
+        )
+    
+    # Pydantic-style aliases so existing call sites keep working
+    model_dump = to_dict
+    model_validate = from_dict
 
 
 class ExperimentSummary(BaseModel):
@@ -110,4 +234,32 @@ class BenchmarkComparison(BaseModel):
     
     # Statistical significance (if applicable)
     quality_variance: Dict[str, float]
-    significant_differences: List[str]
\ No newline at end of file
+    significant_differences: List[str]
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize the Pydantic models nested in result dataclasses"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode='json')
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dump_result(result: ExperimentResult) -> bytes:
+    """
+    Serialize one ExperimentResult to JSON bytes
+    
+    orjson encodes the dataclass fields (including nested QualityMetrics and
+    the timestamp) natively; only the ExperimentConfig goes through Pydantic.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(result, default=_orjson_default)
+    return json.dumps(result.to_dict(mode='json')).encode()
+
+
+def dump_summary(summary: ExperimentSummary) -> bytes:
+    """Serialize an ExperimentSummary, results included, to indented JSON bytes"""
+    if not ORJSON_AVAILABLE:
+        return json.dumps(summary.model_dump(mode='json'), indent=2, default=str).encode()
+    summary_dict = summary.model_dump(mode='json', exclude={'results'})
+    summary_dict['results'] = summary.results
+    return orjson.dumps(summary_dict, default=_orjson_default, option=orjson.OPT_INDENT_2)
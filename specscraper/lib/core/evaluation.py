@@ -1,10 +1,52 @@
+import functools
 import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 import requests
 from urllib.parse import urlparse
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Iterable
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import Counter
+from operator import itemgetter
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Patterns and vocabularies used per field, built once at import
+_MODEL_RE = re.compile(r'[A-Z]{2,}[-\s]?\d+')
+_QTY_RE = re.compile(r'\d+')
+_UNKNOWN_QTY_WORDS = ('unspecified', 'unknown', 'n/a')
+
+# Field score keys in the order evaluate_extraction fills them
+_SCORED_FIELDS = (
+    'image_url', 'product_link', 'type', 'description', 'model_no', 'qty', 'consistency'
+)
+_scored_field_values = itemgetter(*_SCORED_FIELDS)
+
+# Overall-score weight per field, in _SCORED_FIELDS order
+_FIELD_WEIGHTS = tuple(zip(_SCORED_FIELDS, (0.2, 0.2, 0.15, 0.25, 0.05, 0.05, 0.1)))
+
+# The same image/product URLs are parsed several times per extraction
+_parse_url = functools.lru_cache(maxsize=8192)(urlparse)
+
+
+def _loads(json_str):
+    """Parse JSON with orjson when available, deferring to json on failure
+
+    orjson is stricter than json (NaN/Infinity, huge ints), so anything it
+    rejects is re-parsed by json.loads, which either accepts it or raises
+    the same JSONDecodeError the evaluator has always reported.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(json_str)
 
 @dataclass
 class EvalResult:
@@ -39,7 +81,7 @@ class ProductExtractionEvaluator:
 
         # 1. JSON Parseability Test
         try:
-            data = json.loads(json_str)
+            data = _loads(json_str)
             json_parseable = True
         except json.JSONDecodeError as e:
             return EvalResult(
@@ -95,10 +137,13 @@ class ProductExtractionEvaluator:
         if not self._is_valid_url(url):
             return 0.2
 
-        # Check if it's a reasonable image/product URL
-        if any(ext in url.lower() for ext in ['.jpg', '.png', '.jpeg', '.webp', '.gif']):
+        # Check if it's a reasonable image/product URL (one lowercase copy,
+        # unrolled C-level substring checks instead of a generator)
+        url_lower = url.lower()
+        if ('.jpg' in url_lower or '.png' in url_lower or '.jpeg' in url_lower
+                or '.webp' in url_lower or '.gif' in url_lower):
             return 1.0
-        elif 'image' in url.lower() or 'photo' in url.lower() or 'product' in url.lower():
+        elif 'image' in url_lower or 'photo' in url_lower or 'product' in url_lower:
             return 0.8
         else:
             return 0.6
@@ -106,7 +151,7 @@ class ProductExtractionEvaluator:
     def _is_valid_url(self, url: str) -> bool:
         """Check if URL is properly formatted"""
         try:
-            result = urlparse(url)
+            result = _parse_url(url)
             return all([result.scheme, result.netloc])
         except Exception:
             return False
@@ -116,14 +161,12 @@ class ProductExtractionEvaluator:
         if not type_val or type_val.strip() == "":
             return 0.0
 
-        # Check for reasonable product categories
-        common_types = [
-            'furniture', 'electronics', 'clothing', 'kitchen', 'outdoor',
-            'fireplace', 'appliance', 'tool', 'decoration', 'lighting'
-        ]
-
+        # Check for reasonable product categories (unrolled C-level substring checks)
         type_lower = type_val.lower()
-        if any(cat in type_lower for cat in common_types):
+        if ('furniture' in type_lower or 'electronics' in type_lower or 'clothing' in type_lower
+                or 'kitchen' in type_lower or 'outdoor' in type_lower or 'fireplace' in type_lower
+                or 'appliance' in type_lower or 'tool' in type_lower or 'decoration' in type_lower
+                or 'lighting' in type_lower):
             return 1.0
         elif len(type_val.strip()) > 2:
             return 0.7
@@ -153,7 +196,7 @@ class ProductExtractionEvaluator:
             return 0.5  # Neutral - not always available
 
         # Look for typical model patterns
-        if re.search(r'[A-Z]{2,}[-\s]?\d+', model):
+        if _MODEL_RE.search(model):
             return 1.0
         elif len(model.strip()) > 2:
             return 0.7
@@ -166,9 +209,9 @@ class ProductExtractionEvaluator:
             return 0.5
 
         qty_lower = qty.lower().strip()
-        if any(word in qty_lower for word in ['unspecified', 'unknown', 'n/a']):
+        if any(word in qty_lower for word in _UNKNOWN_QTY_WORDS):
             return 0.8  # Honest about not knowing
-        elif re.search(r'\d+', qty):
+        elif _QTY_RE.search(qty):
             return 1.0
         else:
             return 0.6
@@ -180,15 +223,15 @@ class ProductExtractionEvaluator:
         # Check if product_link and image_url are from same domain
         try:
             if data.get("product_link") and data.get("image_url"):
-                prod_domain = urlparse(data["product_link"]).netloc
-                img_domain = urlparse(data["image_url"]).netloc
+                prod_domain = _parse_url(data["product_link"]).netloc
+                img_domain = _parse_url(data["image_url"]).netloc
 
                 if prod_domain and img_domain:
                     # Same domain is good
                     if prod_domain == img_domain:
                         score += 0.1
-                    # Different but reasonable domains
-                    elif any(common in prod_domain for common in img_domain.split('.')):
+                    # Different hosts under the same registrable domain (e.g. cdn.x.com / www.x.com)
+                    elif prod_domain.rsplit('.', 2)[-2:] == img_domain.rsplit('.', 2)[-2:]:
                         score += 0.05
         except Exception:
             score -= 0.1
@@ -202,18 +245,9 @@ class ProductExtractionEvaluator:
             return 0.2
 
         # Weighted scoring
-        weights = {
-            "image_url": 0.2,
-            "product_link": 0.2,
-            "type": 0.15,
-            "description": 0.25,
-            "model_no": 0.05,
-            "qty": 0.05,
-            "consistency": 0.1
-        }
-
-        weighted_score = sum(field_scores.get(field, 0) * weight
-                           for field, weight in weights.items())
+        weighted_score = 0
+        for field, weight in _FIELD_WEIGHTS:
+            weighted_score += field_scores.get(field, 0) * weight
 
         # Penalty for invalid URLs
         if not urls_valid:
@@ -231,36 +265,88 @@ class ProductExtractionEvaluator:
         Returns:
             Dictionary with batch evaluation results
         """
-        results = []
-        for json_str, source_url in extractions:
-            result = self.evaluate_extraction(json_str, source_url)
-            results.append(result)
+        return self._summarize_batch(
+            self.evaluate_extraction(json_str, source_url) for json_str, source_url in extractions
+        )
+
+    def evaluate_batch_parallel(self, extractions: List[Tuple[str, str]],
+                                workers: int = None) -> Dict[str, Any]:
+        """
+        Evaluate multiple extractions across worker processes
 
-        # Calculate batch statistics
-        scores = [r.overall_score for r in results]
-        field_scores = defaultdict(list)
+        Each extraction is independent CPU work (JSON parse, regex, URL
+        parsing), so chunks are spread over a process pool. Results come
+        back in input order and are summarized exactly like evaluate_batch.
 
-        for result in results:
-            for field, score in result.field_quality_scores.items():
-                field_scores[field].append(score)
+        Args:
+            extractions: List of (json_string, source_url) tuples
+            workers: Number of worker processes (defaults to the CPU count)
+
+        Returns:
+            Dictionary with batch evaluation results
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(extractions) < 2:
+            return self.evaluate_batch(extractions)
+
+        json_strs = [json_str for json_str, _ in extractions]
+        source_urls = [source_url for _, source_url in extractions]
+        chunksize = max(1, len(extractions) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return self._summarize_batch(executor.map(
+                self.evaluate_extraction, json_strs, source_urls, chunksize=chunksize
+            ))
+
+    def _summarize_batch(self, results: Iterable[EvalResult]) -> Dict[str, Any]:
+        """Compute and print summary statistics for evaluated extractions
+
+        Results are consumed in a single streaming pass with running sums, so
+        callers can pass a generator and never hold every EvalResult at once.
+        """
+        n = 0
+        score_sum = 0
+        min_score = max_score = None
+        parseable_n = required_n = url_valid_n = 0
+        # Only parsed extractions carry field scores; they all share _SCORED_FIELDS
+        field_sums = [0] * len(_SCORED_FIELDS)
+        field_n = 0
+        low_quality = []
+        issue_counts = Counter()
+
+        for i, result in enumerate(results):
+            n += 1
+            score = result.overall_score
+            score_sum += score
+            if min_score is None or score < min_score:
+                min_score = score
+            if max_score is None or score > max_score:
+                max_score = score
+            if score < 0.6:
+                low_quality.append(i)
+            parseable_n += result.json_parseable
+            required_n += result.required_fields_present
+            url_valid_n += result.url_valid
+            if result.field_quality_scores:
+                field_n += 1
+                for j, value in enumerate(_scored_field_values(result.field_quality_scores)):
+                    field_sums[j] += value
+            issue_counts.update(result.issues)
 
         # Aggregate statistics
         batch_stats = {
-            "total_extractions": len(results),
-            "avg_score": sum(scores) / len(scores) if scores else 0,
-            "min_score": min(scores) if scores else 0,
-            "max_score": max(scores) if scores else 0,
-            "json_parse_success_rate": sum(1 for r in results if r.json_parseable) / len(results),
-            "required_fields_success_rate": sum(1 for r in results if r.required_fields_present) / len(results),
-            "url_validity_rate": sum(1 for r in results if r.url_valid) / len(results),
-            "field_avg_scores": {
-                field: sum(scores) / len(scores) if scores else 0
-                for field, scores in field_scores.items()
-            },
-            "low_quality_extractions": [
-                i for i, result in enumerate(results) if result.overall_score < 0.6
-            ],
-            "common_issues": self._get_common_issues(results)
+            "total_extractions": n,
+            "avg_score": score_sum / n if n else 0,
+            "min_score": min_score if n else 0,
+            "max_score": max_score if n else 0,
+            "json_parse_success_rate": parseable_n / n,
+            "required_fields_success_rate": required_n / n,
+            "url_validity_rate": url_valid_n / n,
+            "field_avg_scores": (
+                {field: total / field_n for field, total in zip(_SCORED_FIELDS, field_sums)}
+                if field_n else {}
+            ),
+            "low_quality_extractions": low_quality,
+            "common_issues": dict(sorted(issue_counts.items(), key=lambda x: x[1], reverse=True))
         }
 
         print("=== BATCH EVALUATION RESULTS ===")
@@ -282,11 +368,3 @@ class ProductExtractionEvaluator:
                 print(f"  {issue}: {count} occurrences")
 
         return batch_stats
-
-    def _get_common_issues(self, results: List[EvalResult]) -> Dict[str, int]:
-        """Find most common issues across extractions"""
-        issue_counts = defaultdict(int)
-        for result in results:
-            for issue in result.issues:
-                issue_counts[issue] += 1
-        return dict(sorted(issue_counts.items(), key=lambda x: x[1], reverse=True))
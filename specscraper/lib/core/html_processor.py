@@ -1,10 +1,27 @@
+from dataclasses import dataclass
 from pydantic import BaseModel
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from typing import List, Dict, Optional, Tuple
+from bs4 import BeautifulSoup, Tag
 
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
 
-class ImgTag(BaseModel):
-    """Pydantic model for image tag"""
+# lxml's C tokenizer is much faster than the pure-Python html.parser backend
+HTML_PARSER = "lxml" if LXML_AVAILABLE else "html.parser"
+
+# Tags whose whole subtree is dropped before text extraction
+REMOVE_TAGS = frozenset({
+    "script", "style", "noscript", "svg", "footer", "header",
+    "nav", "form", "iframe", "aside", "canvas", "button", "input", "select", "option"
+})
+
+
+@dataclass(slots=True)
+class ImgTag:
+    """Image tag; a plain dataclass since one is built per <img> on every page"""
     src: str
     alt: str
 
@@ -19,6 +36,40 @@ class ProcessedHTML(BaseModel):
 class HTMLProcessor:
     """Service for processing raw HTML content"""
     
+    @staticmethod
+    def _walk(soup: BeautifulSoup) -> Tuple[List[str], List[Tag], List[Tag], Optional[Tag]]:
+        """
+        Walk the tree once in document order, skipping noise subtrees
+
+        Returns the stripped visible strings (as soup.get_text(strip=True) would
+        yield them), the meta tags, the img tags and the first title tag.
+        """
+        # Same string filter get_text applies (NavigableString/CData, no comments)
+        types = soup.interesting_string_types
+        if isinstance(types, type):
+            types = (types,)
+        strings, metas, imgs = [], [], []
+        title_tag = None
+        stack = list(reversed(soup.contents))
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Tag):
+                name = node.name
+                if name in REMOVE_TAGS:
+                    continue
+                if name == "meta":
+                    metas.append(node)
+                elif name == "img":
+                    imgs.append(node)
+                elif name == "title" and title_tag is None:
+                    title_tag = node
+                stack.extend(reversed(node.contents))
+            elif type(node) in types:
+                stripped = node.strip()
+                if stripped:
+                    strings.append(stripped)
+        return strings, metas, imgs, title_tag
+
     @staticmethod
     def clean_html(raw_html: str) -> ProcessedHTML:
         """
@@ -30,21 +81,16 @@ class HTMLProcessor:
         Returns:
             ProcessedHTML: Processed HTML content in structured format
         """
-        soup = BeautifulSoup(raw_html, "html.parser")
-
-        REMOVE_TAGS = [
-            "script", "style", "noscript", "svg", "footer", "header",
-            "nav", "form", "iframe", "aside", "canvas", "button", "input", "select", "option"
-        ]
+        soup = BeautifulSoup(raw_html, HTML_PARSER)
 
         GARBAGE_KEYWORDS = ["cookie", "newsletter", "subscribe", "banner", "social", "share", "advert"]
 
         preprocessed_html = {}
 
 
-        # Remove noise tags
-        for tag in soup(REMOVE_TAGS):
-            tag.decompose()
+        # Single document-order walk collecting text, meta, img and title while
+        # skipping noise subtrees, so they never need to be decomposed
+        strings, metas, imgs, title_tag = HTMLProcessor._walk(soup)
 
         # # Remove elements with garbage classes/ids
         # for el in soup.find_all(attrs={"class": True}):
@@ -58,27 +104,27 @@ class HTMLProcessor:
         #         el.decompose()
 
         # Extract visible text
-        text = soup.get_text(separator="\n", strip=True)
+        text = "\n".join(strings)
         text_lines = [line.strip() for line in text.splitlines() if line.strip()]
         visible_text = "\n".join(text_lines)
 
         # Extract metadata
         metadata = {
             (tag.get("property") or tag.get("name")) or "unknown": str(tag.get("content"))
-            for tag in soup.find_all("meta")
+            for tag in metas
             if tag.get("content")
         }
 
         # Extract images with alt text
         images = []
-        for img in soup.find_all("img"):
+        for img in imgs:
             src = img.get("src")
             alt = img.get("alt", "").strip()
             if src:
-                images.append({"src": src, "alt": alt})
+                images.append(ImgTag(src=src, alt=alt))
 
         return ProcessedHTML(
-            title=soup.title.string.strip() if soup.title and soup.title.string else "",
+            title=title_tag.string.strip() if title_tag and title_tag.string else "",
             metadata=metadata,
             text=visible_text,
             images=images
@@ -1,5 +1,10 @@
 """LLM integration module with invocation and prompt templating"""
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from hashlib import blake2b
+import threading
 from openai import OpenAI
 from dotenv import load_dotenv
 import os
@@ -7,10 +12,71 @@ import logging
 from pydantic import BaseModel, Field
 from lib.utils.openai_rate_limiter import OpenAIRateLimiter
 
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+# Load environment variables
+load_dotenv()
+
 # Create standard logger - no configuration
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _get_openai_client(api_key: str) -> OpenAI:
+    """Return a process-wide OpenAI client so invocators share one connection pool"""
+    return OpenAI(api_key=api_key)
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    """Return the tiktoken encoding for a model, or None if it cannot be resolved"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except (KeyError, ValueError, OSError):
+        # Unknown model name or the BPE file could not be fetched
+        return None
+
+
+# Token counts of recently estimated prompts, keyed by (model, hash(prompt),
+# len(prompt)) so retries skip re-tokenizing without keeping prompts alive
+_TOKEN_COUNT_CACHE_SIZE = 256
+_token_counts: "OrderedDict[Tuple[str, int, int], int]" = OrderedDict()
+_token_counts_lock = threading.Lock()
+
+
+def _estimate_tokens(prompt: str, model: str) -> int:
+    """
+    Estimate the number of input tokens in a prompt
+    
+    Uses the model's tiktoken encoding when available, otherwise the rough
+    approximation of 1 token ≈ 4 characters. Tokenized counts are cached so
+    retried prompts are not re-tokenized.
+    """
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return len(prompt) // 4
+    
+    key = (model, hash(prompt), len(prompt))
+    with _token_counts_lock:
+        count = _token_counts.get(key)
+        if count is not None:
+            _token_counts.move_to_end(key)
+            return count
+    
+    count = len(encoding.encode(prompt, disallowed_special=()))
+    with _token_counts_lock:
+        _token_counts[key] = count
+        while len(_token_counts) > _TOKEN_COUNT_CACHE_SIZE:
+            _token_counts.popitem(last=False)
+    return count
+
+
 class PromptTemplator:
     """Service for creating prompts for various use cases"""
     
@@ -25,6 +91,20 @@ class PromptTemplator:
         model_no: str = Field(description="Manufacturer model number, item no, or sku no.")
         product_link: str = Field(description="Original product page URL")
 
+        @classmethod
+        def empty(cls) -> "PromptTemplator.ProductExtractionOutput":
+            """Blank output for rows without a usable LLM response"""
+            return cls(
+                product_name="",
+                manufacturer="",
+                image_url="",
+                type="",
+                price=0.0,
+                specification="",
+                model_no="",
+                product_link="",
+            )
+
     @staticmethod
     def product_extraction(product_url: str, product_data: str) -> str:
         """
@@ -222,17 +302,31 @@ class PromptTemplator:
 class LLMInvocator:
     """Service for invoking LLM models with rate limiting"""
 
-    def __init__(self):
-        load_dotenv()
-
-        if os.getenv("OPENAI_API_KEY") is None:
+    def __init__(self, cache_size: int = 0):
+        """
+        Args:
+            cache_size (int, optional): Number of responses to keep in an LRU cache
+                keyed by model, sampling parameters and prompt hash. Identical
+                prompts are then answered without an API call. Defaults to 0 (disabled)
+        """
+        api_key = os.getenv("OPENAI_API_KEY")
+        if api_key is None:
             raise ValueError("OPENAI_API_KEY is not set")
         
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = _get_openai_client(api_key)
         self.rate_limiter = OpenAIRateLimiter()
         
+        self.cache_size = cache_size
+        self._response_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
         logger.info("Initialized LLMInvocator with rate limiting")
 
+    def clear_response_cache(self) -> None:
+        """Drop all cached LLM responses"""
+        with self._cache_lock:
+            self._response_cache.clear()
+
     def invoke_llm(
         self,
         model_provider: str,
@@ -257,8 +351,19 @@ class LLMInvocator:
         if model_provider.lower() != "openai":
             raise ValueError(f"Unsupported model provider: {model_provider}")
         
-        # Estimate tokens (rough approximation: 1 token ≈ 4 characters)
-        estimated_input_tokens = len(prompt) // 4
+        cache_key = None
+        if self.cache_size > 0:
+            prompt_digest = blake2b(prompt.encode(), digest_size=16).digest()
+            cache_key = (llm_model_name, temperature, max_tokens, prompt_digest)
+            with self._cache_lock:
+                cached = self._response_cache.get(cache_key)
+                if cached is not None:
+                    self._response_cache.move_to_end(cache_key)
+                    logger.info(f"Using cached response for {llm_model_name}")
+                    return cached
+        
+        # Estimate tokens (tiktoken when available, else 1 token ≈ 4 characters)
+        estimated_input_tokens = _estimate_tokens(prompt, llm_model_name)
         estimated_output_tokens = max_tokens or 1000
         estimated_total_tokens = estimated_input_tokens + estimated_output_tokens
         
@@ -281,12 +386,56 @@ class LLMInvocator:
             self.rate_limiter.update_actual_tokens(llm_model_name, actual_tokens, estimated_total_tokens)
             
             logger.info(f"OpenAI API call successful. Used {actual_tokens} tokens")
-            return response.choices[0].message.content if response.choices[0].message.content else ""
+            content = response.choices[0].message.content if response.choices[0].message.content else ""
+            
+            if cache_key is not None:
+                with self._cache_lock:
+                    self._response_cache[cache_key] = content
+                    self._response_cache.move_to_end(cache_key)
+                    while len(self._response_cache) > self.cache_size:
+                        self._response_cache.popitem(last=False)
+            
+            return content
             
         except Exception as e:
             logger.error(f"OpenAI API call failed: {str(e)}")
             raise
 
+    def invoke_llm_batch(
+        self,
+        model_provider: str,
+        llm_model_name: str,
+        prompts: List[str],
+        temperature: Optional[float] = 0.7,
+        max_tokens: Optional[int] = 1000,
+        max_workers: int = 20
+    ) -> List[str]:
+        """
+        Invoke an LLM model for many prompts concurrently
+        
+        Requests overlap on the shared client's connection pool while the
+        thread-safe rate limiter still gates every call.
+        
+        Args:
+            model_provider (str): Provider of the LLM (e.g., 'openai', 'anthropic')
+            llm_model_name (str): Name of the specific model to use
+            prompts (List[str]): Input prompts for the LLM
+            temperature (float, optional): Sampling temperature. Defaults to 0.7
+            max_tokens (int, optional): Maximum tokens in response. Defaults to 1000
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 20
+            
+        Returns:
+            List[str]: LLM response texts, in the same order as prompts
+        """
+        if not prompts:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(prompts)))) as executor:
+            return list(executor.map(
+                lambda prompt: self.invoke_llm(model_provider, llm_model_name, prompt, temperature, max_tokens),
+                prompts
+            ))
+
     def get_usage_stats(self, model: str = '') -> dict:
         """
         Get current rate limit usage statistics
@@ -1,4 +1,5 @@
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import random
 import logging
@@ -140,6 +141,8 @@ class FirecrawlApiClient:
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://api.firecrawl.dev/v1"
+        # Keep-alive session so repeated calls reuse the TLS connection
+        self.session = requests.Session()
 
     def scrape_url(self, url: str, formats: List[str] = None, only_main_content: bool = False,
                    timeout: int = 60000, parse_pdf: bool = False, max_age: int = 14400000):
@@ -166,7 +169,7 @@ class FirecrawlApiClient:
         }
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/scrape",
                 headers=headers,
                 json=payload,
@@ -221,6 +224,11 @@ class StealthScraper:
         self._window_start = time.time()
 
         self.session = requests.Session()
+        # Larger keep-alive pools so worker threads hitting the same hosts
+        # reuse connections instead of re-handshaking (retries stay manual)
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
         # Get Firecrawl API key from environment variable
         self.firecrawl_api_key = os.getenv('FIRECRAWL_API_KEY')
@@ -1,15 +1,81 @@
 """Error analysis and categorization for pipeline monitoring"""
+import functools
 import json
-from collections import defaultdict
+from collections import Counter
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
+import numpy as np
 import pandas as pd
-from .models import PipelineError, ErrorCategory, PipelineExecution, PipelineStage
+from .models import (
+    PipelineError, ErrorCategory, PipelineExecution, PipelineStage,
+    ERROR_CATEGORIES, ERROR_CATEGORY_CODES, PIPELINE_STAGES, PIPELINE_STAGE_CODES
+)
+
+# Optional pyahocorasick for matching all category keywords in one pass
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# Resolution suggestions per error category (shared, immutable)
+_RESOLUTION_SUGGESTIONS: Dict[ErrorCategory, Tuple[str, ...]] = {
+    ErrorCategory.BOT_DETECTION: (
+        "Consider using Firecrawl as fallback for this URL",
+        "Add more realistic browser headers and behaviors",
+        "Implement random delays between requests",
+        "Check if the site requires specific cookies or session data"
+    ),
+    ErrorCategory.RATE_LIMIT: (
+        "Reduce concurrent workers in ThreadPoolExecutor",
+        "Implement exponential backoff for retries",
+        "Add delays between requests to the same domain",
+        "Consider spreading requests over a longer time period"
+    ),
+    ErrorCategory.NETWORK_ERROR: (
+        "Check network connectivity and DNS resolution",
+        "Increase timeout values for slow-loading sites",
+        "Implement retry logic with backoff",
+        "Verify SSL certificates are valid"
+    ),
+    ErrorCategory.FIRECRAWL_ERROR: (
+        "Check Firecrawl API token balance",
+        "Reduce the number of Firecrawl requests",
+        "Cache successful Firecrawl results",
+        "Consider upgrading Firecrawl plan for more tokens"
+    ),
+    ErrorCategory.LLM_ERROR: (
+        "Verify OpenAI API key is valid",
+        "Check OpenAI API rate limits and quotas",
+        "Reduce prompt size if hitting token limits",
+        "Implement retry logic for transient API errors"
+    ),
+    ErrorCategory.VALIDATION_ERROR: (
+        "Review the HTML cleaning process",
+        "Check if website structure has changed",
+        "Validate that all required fields are extracted",
+        "Consider more robust error handling in extraction"
+    ),
+}
+
+
+def _count_by_code(codes: np.ndarray, members: tuple) -> Dict[str, int]:
+    """Count enum codes, keyed by enum value in order of first appearance"""
+    counts = np.bincount(codes, minlength=len(members))
+    present, first_seen = np.unique(codes, return_index=True)
+    return {
+        members[code].value: int(counts[code])
+        for code in present[np.argsort(first_seen)].tolist()
+    }
 
 
 class ErrorAnalyzer:
     """Analyzes and categorizes errors from pipeline executions"""
     
+    # Distinct (normalized) error messages remembered by categorize_error_message
+    CATEGORY_CACHE_SIZE = 4096
+    
     def __init__(self):
         self.error_patterns = {
             ErrorCategory.BOT_DETECTION: [
@@ -36,6 +102,29 @@ class ErrorAnalyzer:
                 "format error", "type error"
             ]
         }
+        self._build_keyword_index()
+        # Pipelines repeat the same few error strings, so memoize per analyzer
+        self._categorize_cached = functools.lru_cache(maxsize=self.CATEGORY_CACHE_SIZE)(
+            self._categorize_normalized
+        )
+    
+    def _build_keyword_index(self):
+        """Derive the category order and keyword automaton from error_patterns"""
+        self._categories = list(self.error_patterns)
+        self._keyword_automaton = (
+            self._build_keyword_automaton(self.error_patterns) if AHOCORASICK_AVAILABLE else None
+        )
+    
+    @staticmethod
+    def _build_keyword_automaton(error_patterns: Dict[ErrorCategory, List[str]]):
+        """Build an Aho-Corasick automaton mapping each keyword to its category priority"""
+        automaton = ahocorasick.Automaton()
+        for priority, patterns in enumerate(error_patterns.values()):
+            for pattern in patterns:
+                # A keyword listed under several categories keeps the first
+                automaton.add_word(pattern, min(priority, automaton.get(pattern, priority)))
+        automaton.make_automaton()
+        return automaton
     
     def analyze_errors(self, executions: List[PipelineExecution]) -> Dict[str, Any]:
         """Analyze errors across multiple executions"""
@@ -46,22 +135,22 @@ class ErrorAnalyzer:
         if not all_errors:
             return {"total_errors": 0, "error_analysis": {}}
         
-        # Group by category
-        errors_by_category = defaultdict(list)
-        for error in all_errors:
-            errors_by_category[error.category.value].append(error)
-        
-        # Group by stage
-        errors_by_stage = defaultdict(list)
-        for error in all_errors:
-            errors_by_stage[error.stage.value].append(error)
+        # Count by category and by stage
+        count = len(all_errors)
+        category_codes = np.fromiter(
+            (ERROR_CATEGORY_CODES[error.category] for error in all_errors), dtype=np.intp, count=count
+        )
+        stage_codes = np.fromiter(
+            (PIPELINE_STAGE_CODES[error.stage] for error in all_errors), dtype=np.intp, count=count
+        )
+        errors_by_category = _count_by_code(category_codes, ERROR_CATEGORIES)
+        errors_by_stage = _count_by_code(stage_codes, PIPELINE_STAGES)
         
         # Find most common error messages
-        error_messages = defaultdict(int)
-        for error in all_errors:
-            # Normalize error message for grouping
-            normalized = self._normalize_error_message(error.error_message)
-            error_messages[normalized] += 1
+        # Normalize error messages for grouping
+        error_messages = Counter(
+            self._normalize_error_message(error.error_message) for error in all_errors
+        )
         
         # Analyze error patterns over time
         error_timeline = self._create_error_timeline(all_errors)
@@ -71,17 +160,9 @@ class ErrorAnalyzer:
         
         return {
             "total_errors": len(all_errors),
-            "errors_by_category": {
-                cat: len(errors) for cat, errors in errors_by_category.items()
-            },
-            "errors_by_stage": {
-                stage: len(errors) for stage, errors in errors_by_stage.items()
-            },
-            "top_error_messages": dict(sorted(
-                error_messages.items(), 
-                key=lambda x: x[1], 
-                reverse=True
-            )[:10]),
+            "errors_by_category": errors_by_category,
+            "errors_by_stage": errors_by_stage,
+            "top_error_messages": dict(error_messages.most_common(10)),
             "error_timeline": error_timeline,
             "insights": insights,
             "affected_urls": self._get_affected_urls(all_errors)
@@ -89,7 +170,24 @@ class ErrorAnalyzer:
     
     def categorize_error_message(self, error_message: str) -> ErrorCategory:
         """Categorize an error message based on patterns"""
-        error_lower = error_message.lower()
+        return self._categorize_cached(error_message.lower().strip())
+    
+    def clear_category_cache(self):
+        """Forget memoized categorizations and rebuild the keyword index (e.g. after editing error_patterns)"""
+        self._build_keyword_index()
+        self._categorize_cached.cache_clear()
+    
+    def _categorize_normalized(self, error_lower: str) -> ErrorCategory:
+        """Categorize an already lower-cased, stripped error message"""
+        if self._keyword_automaton is not None:
+            # Single scan reporting every keyword hit; keep the highest priority
+            best = len(self._categories)
+            for _, priority in self._keyword_automaton.iter(error_lower):
+                if priority < best:
+                    best = priority
+                    if best == 0:
+                        break
+            return self._categories[best] if best < len(self._categories) else ErrorCategory.UNKNOWN_ERROR
         
         for category, patterns in self.error_patterns.items():
             if any(pattern in error_lower for pattern in patterns):
@@ -144,52 +242,8 @@ class ErrorAnalyzer:
     
     def get_error_resolution_suggestions(self, error: PipelineError) -> List[str]:
         """Get suggestions for resolving specific errors"""
-        suggestions = []
-        
-        if error.category == ErrorCategory.BOT_DETECTION:
-            suggestions.extend([
-                "Consider using Firecrawl as fallback for this URL",
-                "Add more realistic browser headers and behaviors",
-                "Implement random delays between requests",
-                "Check if the site requires specific cookies or session data"
-            ])
-        elif error.category == ErrorCategory.RATE_LIMIT:
-            suggestions.extend([
-                "Reduce concurrent workers in ThreadPoolExecutor",
-                "Implement exponential backoff for retries",
-                "Add delays between requests to the same domain",
-                "Consider spreading requests over a longer time period"
-            ])
-        elif error.category == ErrorCategory.NETWORK_ERROR:
-            suggestions.extend([
-                "Check network connectivity and DNS resolution",
-                "Increase timeout values for slow-loading sites",
-                "Implement retry logic with backoff",
-                "Verify SSL certificates are valid"
-            ])
-        elif error.category == ErrorCategory.FIRECRAWL_ERROR:
-            suggestions.extend([
-                "Check Firecrawl API token balance",
-                "Reduce the number of Firecrawl requests",
-                "Cache successful Firecrawl results",
-                "Consider upgrading Firecrawl plan for more tokens"
-            ])
-        elif error.category == ErrorCategory.LLM_ERROR:
-            suggestions.extend([
-                "Verify OpenAI API key is valid",
-                "Check OpenAI API rate limits and quotas",
-                "Reduce prompt size if hitting token limits",
-                "Implement retry logic for transient API errors"
-            ])
-        elif error.category == ErrorCategory.VALIDATION_ERROR:
-            suggestions.extend([
-                "Review the HTML cleaning process",
-                "Check if website structure has changed",
-                "Validate that all required fields are extracted",
-                "Consider more robust error handling in extraction"
-            ])
-        
-        return suggestions
+        # Fresh list per call so callers may extend it without touching the shared table
+        return list(_RESOLUTION_SUGGESTIONS.get(error.category, ()))
     
     def _normalize_error_message(self, message: str) -> str:
         """Normalize error message for grouping similar errors"""
@@ -211,22 +265,17 @@ class ErrorAnalyzer:
     
     def _create_error_timeline(self, errors: List[PipelineError]) -> Dict[str, int]:
         """Create timeline of errors by hour"""
-        timeline = defaultdict(int)
-        
-        for error in errors:
-            hour_key = error.timestamp.strftime("%Y-%m-%d %H:00")
-            timeline[hour_key] += 1
-            
+        timeline = Counter(error.timestamp.strftime("%Y-%m-%d %H:00") for error in errors)
         return dict(sorted(timeline.items()))
     
-    def _generate_insights(self, errors_by_category: Dict[str, List[PipelineError]], 
-                         errors_by_stage: Dict[str, List[PipelineError]]) -> List[str]:
+    def _generate_insights(self, errors_by_category: Dict[str, int], 
+                         errors_by_stage: Dict[str, int]) -> List[str]:
         """Generate actionable insights from error analysis"""
         insights = []
         
         # Check for high bot detection rate
-        bot_errors = len(errors_by_category.get(ErrorCategory.BOT_DETECTION.value, []))
-        total_errors = sum(len(errors) for errors in errors_by_category.values())
+        bot_errors = errors_by_category.get(ErrorCategory.BOT_DETECTION.value, 0)
+        total_errors = sum(errors_by_category.values())
         
         if total_errors > 0:
             bot_rate = bot_errors / total_errors
@@ -237,7 +286,7 @@ class ErrorAnalyzer:
                 )
         
         # Check for rate limiting issues
-        rate_limit_errors = len(errors_by_category.get(ErrorCategory.RATE_LIMIT.value, []))
+        rate_limit_errors = errors_by_category.get(ErrorCategory.RATE_LIMIT.value, 0)
         if rate_limit_errors > 5:
             insights.append(
                 f"Multiple rate limit errors ({rate_limit_errors}) - Reduce concurrent workers "
@@ -245,8 +294,8 @@ class ErrorAnalyzer:
             )
         
         # Check for concentration of errors in specific stages
-        for stage, errors in errors_by_stage.items():
-            stage_error_rate = len(errors) / total_errors if total_errors > 0 else 0
+        for stage, stage_errors in errors_by_stage.items():
+            stage_error_rate = stage_errors / total_errors if total_errors > 0 else 0
             if stage_error_rate > 0.5:
                 insights.append(
                     f"Most errors ({stage_error_rate:.1%}) occur in {stage} stage - "
@@ -254,7 +303,7 @@ class ErrorAnalyzer:
                 )
         
         # Check for network issues
-        network_errors = len(errors_by_category.get(ErrorCategory.NETWORK_ERROR.value, []))
+        network_errors = errors_by_category.get(ErrorCategory.NETWORK_ERROR.value, 0)
         if network_errors > 10:
             insights.append(
                 f"High number of network errors ({network_errors}) - Check network stability "
@@ -265,13 +314,8 @@ class ErrorAnalyzer:
     
     def _get_affected_urls(self, errors: List[PipelineError]) -> Dict[str, int]:
         """Get URLs most affected by errors"""
-        url_errors = defaultdict(int)
-        
-        for error in errors:
-            if error.url:
-                url_errors[error.url] += 1
-                
-        return dict(sorted(url_errors.items(), key=lambda x: x[1], reverse=True))
+        url_errors = Counter(error.url for error in errors if error.url)
+        return dict(url_errors.most_common())
     
     def export_error_analysis(self, executions: List[PipelineExecution], output_path: str):
         """Export detailed error analysis to CSV"""
@@ -1,11 +1,124 @@
 """Metrics collection and aggregation for pipeline monitoring"""
+import io
 import json
+import math
+import os
+from array import array
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
 import pandas as pd
-from .models import PipelineMetric, PipelineExecution, MetricType
+from .models import PipelineMetric, PipelineExecution, MetricType, CounterIdx, FrozenLabels, counter_matrix
+
+# Optional pyarrow for columnar (Parquet) storage of raw metric rows
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None
+    pq = None
+
+
+# Display names for scraping methods in reports
+_METHOD_LABELS = {
+    "requests": "Requests Library",
+    "firecrawl": "Firecrawl API",
+    "cached": "Cached Content",
+}
+
+# Append-only log of completed executions, one JSON record per line
+EXECUTION_LOG = "executions.jsonl"
+
+# Integer codes used to dispatch on metric type per aggregated group
+_COUNTER, _GAUGE, _HISTOGRAM = 0, 1, 2
+_TYPE_CODES = {
+    MetricType.COUNTER.value: _COUNTER,
+    MetricType.GAUGE.value: _GAUGE,
+    MetricType.HISTOGRAM.value: _HISTOGRAM,
+}
+
+# Relative accuracy of the mergeable quantile sketch kept for histograms
+# in the persistent rollup (log-spaced buckets, DDSketch-style)
+_SKETCH_ACCURACY = 0.01
+_SKETCH_GAMMA = (1 + _SKETCH_ACCURACY) / (1 - _SKETCH_ACCURACY)
+_SKETCH_LOG_GAMMA = math.log(_SKETCH_GAMMA)
+
+
+def _sketch_add(sketch: Dict[str, Any], value: float):
+    """Add a value to a log-bucket quantile sketch"""
+    if value <= 0:
+        sketch["zero"] += 1
+        return
+    index = str(math.ceil(math.log(value) / _SKETCH_LOG_GAMMA))
+    buckets = sketch["buckets"]
+    buckets[index] = buckets.get(index, 0) + 1
+
+
+def _sketch_value_at(sketch: Dict[str, Any], rank: int) -> float:
+    """Estimate the value at a 0-based rank from a log-bucket sketch"""
+    seen = sketch["zero"]
+    if seen > rank:
+        return 0.0
+    for index in sorted(int(i) for i in sketch["buckets"]):
+        seen += sketch["buckets"][str(index)]
+        if seen > rank:
+            return 2 * _SKETCH_GAMMA ** index / (_SKETCH_GAMMA + 1)
+    return float("nan")
+
+
+def _sketch_quantile(sketch: Dict[str, Any], q: float, count: int) -> float:
+    """Estimate a quantile, interpolating linearly between neighbouring ranks"""
+    position = q * (count - 1)
+    lower = math.floor(position)
+    low_value = _sketch_value_at(sketch, lower)
+    if lower + 1 >= count:
+        return low_value
+    high_value = _sketch_value_at(sketch, lower + 1)
+    return low_value + (high_value - low_value) * (position - lower)
+
+
+def _segment_aggregates(values: np.ndarray, codes: np.ndarray, n_groups: int) -> Dict[str, list]:
+    """Reduce a flat value array into per-group statistics in one sorted pass.
+
+    Rows are sorted by (group code, value) once; every group is then a
+    contiguous, already-ordered segment, so sums/min/max come from
+    ``reduceat`` and quantiles from direct indexing with the same linear
+    interpolation pandas and numpy use.
+    """
+    order = np.lexsort((values, codes))
+    ordered = values[order]
+    starts = np.searchsorted(codes[order], np.arange(n_groups))
+    counts = np.diff(np.append(starts, len(ordered)))
+    
+    sums = np.add.reduceat(ordered, starts)
+    means = sums / counts
+    deviations = ordered - np.repeat(means, counts)
+    squares = np.add.reduceat(deviations * deviations, starts)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        std = np.sqrt(squares / (counts - 1))
+    std[counts < 2] = np.nan
+    
+    result = {
+        "count": counts.tolist(),
+        "sum": sums.tolist(),
+        "mean": means.tolist(),
+        "min": ordered[starts].tolist(),
+        "max": ordered[starts + counts - 1].tolist(),
+        "std": std.tolist(),
+    }
+    for label, q in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+        position = q * (counts - 1)
+        lower = np.floor(position).astype(np.intp)
+        upper = np.minimum(lower + 1, counts - 1)
+        low_values = ordered[starts + lower]
+        high_values = ordered[starts + upper]
+        result[label] = (low_values + (high_values - low_values) * (position - lower)).tolist()
+    return result
 
 
 class MetricsCollector:
@@ -20,95 +133,158 @@ class MetricsCollector:
         if not executions:
             return {}
             
-        # Collect all metrics
-        all_metrics = []
-        for execution in executions:
-            for metric in execution.metrics:
-                all_metrics.append({
-                    "execution_id": execution.execution_id,
-                    "name": metric.name,
-                    "value": metric.value,
-                    "type": metric.type.value,
-                    "timestamp": metric.timestamp,
-                    "stage": metric.stage.value if metric.stage else None,
-                    **metric.labels
-                })
-        
-        # Convert to DataFrame for easier aggregation
-        df = pd.DataFrame(all_metrics)
+        columns = self._metric_columns(executions)
+        values = columns["value"]
+        if not len(values):
+            return {}
+        
+        # Integer code per metric name, in order of first appearance
+        name_index: Dict[str, int] = {}
+        group_names = []
+        group_types = []
+        row_codes = []
+        for name, metric_type in zip(columns["name"], columns["type"]):
+            code = name_index.get(name)
+            if code is None:
+                code = name_index[name] = len(group_names)
+                group_names.append(name)
+                group_types.append(_TYPE_CODES[metric_type])
+            row_codes.append(code)
+        codes = np.array(row_codes, dtype=np.intp)
+        
+        stats = _segment_aggregates(values, codes, len(group_names))
+        by_execution = self._counter_totals_by_execution(
+            values, codes, columns["execution_id"], np.array(group_types, dtype=np.int8)
+        )
         
         # Aggregate by metric name
         aggregations = {}
         
-        for metric_name in df['name'].unique():
-            metric_data = df[df['name'] == metric_name]
-            metric_type = metric_data['type'].iloc[0]
-            
-            if metric_type == MetricType.COUNTER.value:
+        for group, (metric_name, metric_type) in enumerate(zip(group_names, group_types)):
+            if metric_type == _COUNTER:
                 # Sum counters
                 aggregations[metric_name] = {
                     "type": "counter",
-                    "total": metric_data['value'].sum(),
-                    "count": len(metric_data),
-                    "by_execution": metric_data.groupby('execution_id')['value'].sum().to_dict()
+                    "total": stats["sum"][group],
+                    "count": stats["count"][group],
+                    "by_execution": by_execution[group]
                 }
-            elif metric_type == MetricType.GAUGE.value:
+            elif metric_type == _GAUGE:
                 # Average gauges
                 aggregations[metric_name] = {
                     "type": "gauge",
-                    "mean": metric_data['value'].mean(),
-                    "min": metric_data['value'].min(),
-                    "max": metric_data['value'].max(),
-                    "std": metric_data['value'].std(),
-                    "count": len(metric_data)
+                    "mean": stats["mean"][group],
+                    "min": stats["min"][group],
+                    "max": stats["max"][group],
+                    "std": stats["std"][group],
+                    "count": stats["count"][group]
                 }
-            elif metric_type == MetricType.HISTOGRAM.value:
+            elif metric_type == _HISTOGRAM:
                 # Calculate percentiles for histograms
                 aggregations[metric_name] = {
                     "type": "histogram",
-                    "mean": metric_data['value'].mean(),
-                    "p50": metric_data['value'].quantile(0.5),
-                    "p95": metric_data['value'].quantile(0.95),
-                    "p99": metric_data['value'].quantile(0.99),
-                    "min": metric_data['value'].min(),
-                    "max": metric_data['value'].max(),
-                    "count": len(metric_data)
+                    "mean": stats["mean"][group],
+                    "p50": stats["p50"][group],
+                    "p95": stats["p95"][group],
+                    "p99": stats["p99"][group],
+                    "min": stats["min"][group],
+                    "max": stats["max"][group],
+                    "count": stats["count"][group]
                 }
         
         return aggregations
     
+    @staticmethod
+    def _counter_totals_by_execution(values: np.ndarray, codes: np.ndarray,
+                                     execution_ids: List[str],
+                                     group_types: np.ndarray) -> Dict[int, Dict[str, float]]:
+        """Sum counter values per (metric group, execution id)"""
+        rows = (group_types == _COUNTER)[codes]
+        totals: Dict[int, Dict[str, float]] = defaultdict(dict)
+        if not rows.any():
+            return totals
+        
+        exec_names, exec_codes = np.unique(np.array(execution_ids, dtype=object)[rows],
+                                           return_inverse=True)
+        keys = codes[rows] * len(exec_names) + exec_codes
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        sums = np.bincount(inverse, weights=values[rows])
+        
+        # Keys are sorted, so each group's executions come out in id order
+        for key, total in zip(unique_keys.tolist(), sums.tolist()):
+            group, exec_code = divmod(key, len(exec_names))
+            totals[group][exec_names[exec_code]] = total
+        return totals
+    
+    @staticmethod
+    def _metric_columns(executions: List[PipelineExecution]) -> Dict[str, Any]:
+        """Collect metric rows column-wise (one list or array per field).
+
+        Labels are not copied into rows; the few label values that are
+        reported on (e.g. ``method``) are read explicitly where needed.
+        """
+        execution_ids = []
+        names = []
+        values = array('d')
+        types = []
+        stages = []
+        timestamps = []
+        
+        for execution in executions:
+            execution_id = execution.execution_id
+            for metric in execution.metrics:
+                execution_ids.append(execution_id)
+                names.append(metric.name)
+                values.append(metric.value)
+                types.append(metric.type.value)
+                stages.append(metric.stage.value if metric.stage else None)
+                timestamps.append(metric.timestamp)
+        
+        return {
+            "execution_id": execution_ids,
+            "name": names,
+            "value": np.frombuffer(values, dtype=np.float64),
+            "type": types,
+            "stage": stages,
+            "timestamp": timestamps,
+        }
+    
     def calculate_summary_stats(self, executions: List[PipelineExecution]) -> Dict[str, Any]:
         """Calculate summary statistics across executions"""
         if not executions:
             return {}
             
-        # Overall stats
-        total_urls = sum(e.total_urls for e in executions)
-        total_scraped = sum(e.successful_scrapes + e.failed_scrapes for e in executions)
-        total_successful = sum(e.successful_scrapes for e in executions)
-        total_failed = sum(e.failed_scrapes for e in executions)
-        
-        # Error breakdown
-        total_bot_detections = sum(e.bot_detections for e in executions)
-        total_rate_limits = sum(e.rate_limit_errors for e in executions)
-        total_network_errors = sum(e.network_errors for e in executions)
-        
-        # Cost breakdown
-        total_cost = sum(e.total_cost for e in executions)
-        total_openai_cost = sum(e.openai_cost for e in executions)
-        total_firecrawl_cost = sum(e.firecrawl_cost for e in executions)
-        
-        # OpenAI call stats
-        total_openai_calls = sum(e.successful_llm_calls + e.failed_llm_calls for e in executions)
-        total_successful_llm = sum(e.successful_llm_calls for e in executions)
-        total_failed_llm = sum(e.failed_llm_calls for e in executions)
+        # Counter fields summed across executions in one reduction
+        counters = counter_matrix(executions).sum(axis=0).tolist()
+        total_successful = counters[CounterIdx.SUCCESSFUL_SCRAPES]
+        total_failed = counters[CounterIdx.FAILED_SCRAPES]
+        total_successful_llm = counters[CounterIdx.SUCCESSFUL_LLM_CALLS]
+        total_failed_llm = counters[CounterIdx.FAILED_LLM_CALLS]
+        total_bot_detections = counters[CounterIdx.BOT_DETECTIONS]
+        total_rate_limits = counters[CounterIdx.RATE_LIMIT_ERRORS]
+        total_network_errors = counters[CounterIdx.NETWORK_ERRORS]
+        
+        count = len(executions)
+        total_urls = int(np.fromiter((e.total_urls for e in executions), dtype=np.int64, count=count).sum())
+        
+        # Cost breakdown, one row per execution: total, openai, firecrawl
+        costs = np.array(
+            [(e.total_cost, e.openai_cost, e.firecrawl_cost) for e in executions], dtype=np.float64
+        )
+        total_cost, total_openai_cost, total_firecrawl_cost = costs.sum(axis=0).tolist()
+        
+        # Only finished, non-zero durations count towards the average
+        durations = np.fromiter((e.duration or 0.0 for e in executions), dtype=np.float64, count=count)
+        total_duration = float(durations.sum())
+        duration_count = int(np.count_nonzero(durations))
         
         # Scraping method breakdown
         scrape_methods = defaultdict(int)
         error_by_method = defaultdict(lambda: defaultdict(int))
         
-        # Analyze metrics to extract scraping method counts and errors
+        # Single pass over execution metrics and errors
         for execution in executions:
+            # Scraping method counts from metrics
             for metric in execution.metrics:
                 if metric.name == "scrape.method" and "method" in metric.labels:
                     method = metric.labels["method"]
@@ -120,13 +296,15 @@ class MetricsCollector:
                     method = error.additional_info["scraping_method"]
                     error_by_method[method][error.category.value] += 1
         
+        total_scraped = total_successful + total_failed
+        total_openai_calls = total_successful_llm + total_failed_llm
+        
         # Calculate rates
         overall_success_rate = total_successful / total_scraped if total_scraped > 0 else 0
         llm_success_rate = total_successful_llm / total_openai_calls if total_openai_calls > 0 else 0
         
         # Duration stats
-        durations = [e.duration for e in executions if e.duration]
-        avg_duration = sum(durations) / len(durations) if durations else 0
+        avg_duration = total_duration / duration_count if duration_count else 0
         
         return {
             "executions": len(executions),
@@ -156,96 +334,198 @@ class MetricsCollector:
             },
             "performance": {
                 "avg_duration_seconds": avg_duration,
-                "urls_per_second": total_scraped / sum(durations) if durations else 0
+                "urls_per_second": total_scraped / total_duration if total_duration else 0
             }
         }
     
-    def generate_metrics_report(self, executions: List[PipelineExecution]) -> str:
-        """Generate a human-readable metrics report"""
+    def generate_metrics_report(self, executions: List[PipelineExecution], use_rollup: bool = False) -> str:
+        """
+        Generate a human-readable metrics report
+        
+        With use_rollup, metric aggregates come from the persistent rollup
+        (see update_rollup), so only executions not yet folded into it are
+        reduced; the rollup covers every execution it has ever seen.
+        """
         stats = self.calculate_summary_stats(executions)
-        metrics = self.aggregate_metrics(executions)
+        metrics = self.update_rollup(executions) if use_rollup else self.aggregate_metrics(executions)
         
-        report = ["# Pipeline Metrics Report", ""]
-        report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append("")
+        report = io.StringIO()
+        w = report.write
+        w("# Pipeline Metrics Report\n\n")
+        w(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        w("\n")
         
         # Summary
-        report.append("## Summary Statistics")
-        report.append(f"- Total Executions: {stats['executions']}")
-        report.append(f"- Total URLs Processed: {stats['total_scraped']}/{stats['total_urls']}")
-        report.append(f"- Overall Success Rate: {stats['overall_success_rate']:.2%}")
-        report.append(f"- Average Duration: {stats['performance']['avg_duration_seconds']:.2f}s")
-        report.append(f"- Processing Speed: {stats['performance']['urls_per_second']:.2f} URLs/second")
-        report.append("")
+        w("## Summary Statistics\n")
+        w(f"- Total Executions: {stats['executions']}\n")
+        w(f"- Total URLs Processed: {stats['total_scraped']}/{stats['total_urls']}\n")
+        w(f"- Overall Success Rate: {stats['overall_success_rate']:.2%}\n")
+        w(f"- Average Duration: {stats['performance']['avg_duration_seconds']:.2f}s\n")
+        w(f"- Processing Speed: {stats['performance']['urls_per_second']:.2f} URLs/second\n")
+        w("\n")
         
         # Scraping Method Breakdown
-        report.append("## Scraping Method Breakdown")
+        w("## Scraping Method Breakdown\n")
         if stats['scraping_methods']:
             for method, count in stats['scraping_methods'].items():
-                if method == "requests":
-                    report.append(f"- Requests Library: {count}")
-                elif method == "firecrawl":
-                    report.append(f"- Firecrawl API: {count}")
-                elif method == "cached":
-                    report.append(f"- Cached Content: {count}")
-                else:
-                    report.append(f"- {method.title()}: {count}")
+                w(f"- {_METHOD_LABELS.get(method, method.title())}: {count}\n")
         else:
-            report.append("- No scraping method data available")
-        report.append("")
+            w("- No scraping method data available\n")
+        w("\n")
         
         # OpenAI API Calls
-        report.append("## OpenAI API Usage")
-        report.append(f"- Total API Calls: {stats['openai_calls']['total']}")
-        report.append(f"- Successful Calls: {stats['openai_calls']['successful']}")
-        report.append(f"- Failed Calls: {stats['openai_calls']['failed']}")
-        report.append(f"- Success Rate: {stats['openai_calls']['success_rate']:.2%}")
-        report.append("")
+        w("## OpenAI API Usage\n")
+        w(f"- Total API Calls: {stats['openai_calls']['total']}\n")
+        w(f"- Successful Calls: {stats['openai_calls']['successful']}\n")
+        w(f"- Failed Calls: {stats['openai_calls']['failed']}\n")
+        w(f"- Success Rate: {stats['openai_calls']['success_rate']:.2%}\n")
+        w("\n")
         
         # Error Breakdown
-        report.append("## Error Breakdown")
-        report.append(f"- Bot Detections: {stats['errors']['bot_detections']}")
-        report.append(f"- Rate Limit Errors: {stats['errors']['rate_limits']}")
-        report.append(f"- Network Errors: {stats['errors']['network_errors']}")
-        report.append("")
+        w("## Error Breakdown\n")
+        w(f"- Bot Detections: {stats['errors']['bot_detections']}\n")
+        w(f"- Rate Limit Errors: {stats['errors']['rate_limits']}\n")
+        w(f"- Network Errors: {stats['errors']['network_errors']}\n")
+        w("\n")
         
         # Error Breakdown by Scraping Method
         if stats['errors_by_method']:
-            report.append("## Errors by Scraping Method")
+            w("## Errors by Scraping Method\n")
             for method, errors in stats['errors_by_method'].items():
-                method_name = "Requests Library" if method == "requests" else "Firecrawl API" if method == "firecrawl" else method.title()
-                report.append(f"### {method_name}")
+                method_name = _METHOD_LABELS.get(method, method.title())
+                w(f"### {method_name}\n")
                 total_errors = sum(errors.values())
-                report.append(f"- Total Errors: {total_errors}")
+                w(f"- Total Errors: {total_errors}\n")
                 for error_type, count in errors.items():
                     error_name = error_type.replace('_', ' ').title()
-                    report.append(f"- {error_name}: {count}")
-                report.append("")
+                    w(f"- {error_name}: {count}\n")
+                w("\n")
         
         # Cost Analysis
-        report.append("## Cost Analysis")
-        report.append(f"- Total Cost: ${stats['cost']['total']:.4f}")
-        report.append(f"- OpenAI Cost: ${stats['cost']['openai']:.4f}")
-        report.append(f"- Firecrawl Cost: ${stats['cost']['firecrawl']:.4f}")
-        report.append(f"- Average Cost per URL: ${stats['cost']['avg_per_url']:.4f}")
-        report.append("")
+        w("## Cost Analysis\n")
+        w(f"- Total Cost: ${stats['cost']['total']:.4f}\n")
+        w(f"- OpenAI Cost: ${stats['cost']['openai']:.4f}\n")
+        w(f"- Firecrawl Cost: ${stats['cost']['firecrawl']:.4f}\n")
+        w(f"- Average Cost per URL: ${stats['cost']['avg_per_url']:.4f}\n")
+        w("\n")
         
         # Key Metrics
-        report.append("## Key Metrics")
+        w("## Key Metrics\n")
         for metric_name, data in sorted(metrics.items()):
             if data['type'] == 'counter':
-                report.append(f"- {metric_name}: {data['total']} total")
+                w(f"- {metric_name}: {data['total']} total\n")
             elif data['type'] == 'gauge':
-                report.append(f"- {metric_name}: {data['mean']:.2f} avg (min: {data['min']:.2f}, max: {data['max']:.2f})")
+                w(f"- {metric_name}: {data['mean']:.2f} avg (min: {data['min']:.2f}, max: {data['max']:.2f})\n")
             elif data['type'] == 'histogram':
-                report.append(f"- {metric_name}: p50={data['p50']:.2f}, p95={data['p95']:.2f}, p99={data['p99']:.2f}")
+                w(f"- {metric_name}: p50={data['p50']:.2f}, p95={data['p95']:.2f}, p99={data['p99']:.2f}\n")
         
-        return "\n".join(report)
+        return report.getvalue()
     
-    def save_aggregated_metrics(self, executions: List[PipelineExecution], filename: str = "aggregated_metrics.json"):
-        """Save aggregated metrics to file"""
+    def update_rollup(self, executions: List[PipelineExecution],
+                      filename: str = "rollup.json") -> Dict[str, Any]:
+        """Fold new executions into a persistent rollup and return aggregates.
+
+        Executions already folded into the rollup are skipped, so repeated
+        reports only pay for executions completed since the last call.
+        Counters and gauges are exact (Welford for variance); histogram
+        percentiles come from a mergeable log-bucket sketch and are
+        approximate to within 1% relative error.
+        """
+        filepath = self.metrics_dir / filename
+        if filepath.exists():
+            with open(filepath, 'r') as f:
+                rollup = json.load(f)
+        else:
+            rollup = {"executions": [], "metrics": {}}
+        
+        seen = set(rollup["executions"])
+        states = rollup["metrics"]
+        for execution in executions:
+            if execution.execution_id in seen:
+                continue
+            seen.add(execution.execution_id)
+            rollup["executions"].append(execution.execution_id)
+            
+            for metric in execution.metrics:
+                value = float(metric.value)
+                state = states.get(metric.name)
+                if state is None:
+                    state = states[metric.name] = {
+                        "type": metric.type.value,
+                        "count": 0, "sum": 0.0, "mean": 0.0, "m2": 0.0,
+                        "min": value, "max": value,
+                    }
+                    if state["type"] == MetricType.COUNTER.value:
+                        state["by_execution"] = {}
+                    elif state["type"] == MetricType.HISTOGRAM.value:
+                        state["sketch"] = {"zero": 0, "buckets": {}}
+                
+                state["count"] += 1
+                state["sum"] += value
+                delta = value - state["mean"]
+                state["mean"] += delta / state["count"]
+                state["m2"] += delta * (value - state["mean"])
+                state["min"] = min(state["min"], value)
+                state["max"] = max(state["max"], value)
+                
+                if "by_execution" in state:
+                    by_execution = state["by_execution"]
+                    by_execution[execution.execution_id] = by_execution.get(execution.execution_id, 0.0) + value
+                elif "sketch" in state:
+                    _sketch_add(state["sketch"], value)
+        
+        # Write a sibling temp file and swap it in, so a crash mid-write
+        # never leaves a truncated rollup behind
+        tmp_path = filepath.with_name(filepath.name + ".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(rollup, f)
+        os.replace(tmp_path, filepath)
+        
+        return self._rollup_aggregations(states)
+    
+    @staticmethod
+    def _rollup_aggregations(states: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Convert rollup state into the aggregate_metrics result shape"""
+        aggregations = {}
+        for metric_name, state in states.items():
+            count = state["count"]
+            if state["type"] == MetricType.COUNTER.value:
+                aggregations[metric_name] = {
+                    "type": "counter",
+                    "total": state["sum"],
+                    "count": count,
+                    "by_execution": dict(sorted(state["by_execution"].items()))
+                }
+            elif state["type"] == MetricType.GAUGE.value:
+                aggregations[metric_name] = {
+                    "type": "gauge",
+                    "mean": state["mean"],
+                    "min": state["min"],
+                    "max": state["max"],
+                    "std": math.sqrt(state["m2"] / (count - 1)) if count > 1 else float("nan"),
+                    "count": count
+                }
+            elif state["type"] == MetricType.HISTOGRAM.value:
+                sketch = state["sketch"]
+                percentiles = {
+                    label: min(max(_sketch_quantile(sketch, q, count), state["min"]), state["max"])
+                    for label, q in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))
+                }
+                aggregations[metric_name] = {
+                    "type": "histogram",
+                    "mean": state["mean"],
+                    **percentiles,
+                    "min": state["min"],
+                    "max": state["max"],
+                    "count": count
+                }
+        return aggregations
+    
+    def save_aggregated_metrics(self, executions: List[PipelineExecution], filename: str = "aggregated_metrics.json",
+                                use_rollup: bool = False):
+        """Save aggregated metrics to file (use_rollup as in generate_metrics_report)"""
         stats = self.calculate_summary_stats(executions)
-        metrics = self.aggregate_metrics(executions)
+        metrics = self.update_rollup(executions) if use_rollup else self.aggregate_metrics(executions)
         
         data = {
             "generated_at": datetime.now().isoformat(),
@@ -259,21 +539,154 @@ class MetricsCollector:
         
         return filepath
     
+    def save_metrics_table(self, executions: List[PipelineExecution],
+                           filename: str = "metrics.parquet") -> Optional[Path]:
+        """
+        Save raw metric rows as a Snappy-compressed Parquet table
+        
+        Opt-in companion to save_aggregated_metrics for analytics that need
+        individual metric rows; read it back with load_metrics_table.
+        """
+        if not PYARROW_AVAILABLE:
+            print("pyarrow not available - skipping Parquet metrics table")
+            return None
+        
+        columns = self._metric_columns(executions)
+        
+        # Sorting by name keeps row-group statistics selective for name filters
+        table = pa.table(columns).sort_by("name")
+        filepath = self.metrics_dir / filename
+        pq.write_table(table, filepath, compression='snappy')
+        
+        return filepath
+    
+    def load_metrics_table(self, names: Optional[List[str]] = None,
+                           filename: str = "metrics.parquet") -> pd.DataFrame:
+        """Load raw metric rows from Parquet, optionally filtered by metric name"""
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required to load the Parquet metrics table")
+        
+        filters = [("name", "in", names)] if names else None
+        table = pq.read_table(self.metrics_dir / filename, filters=filters)
+        return table.to_pandas()
+    
+    def append_execution(self, execution: PipelineExecution):
+        """Append an execution record to the rolling execution log"""
+        with open(self.metrics_dir / EXECUTION_LOG, 'a') as f:
+            f.write(execution.model_dump_json() + "\n")
+    
+    def load_execution(self, execution_id: str) -> Optional[PipelineExecution]:
+        """Load a single execution record, from the rolling log or a legacy JSON file"""
+        log_path = self.metrics_dir / EXECUTION_LOG
+        if log_path.exists():
+            # Only validate lines carrying the id, and stop at the first match
+            needle = b'"execution_id":' + json.dumps(execution_id).encode()
+            with open(log_path, 'rb') as f:
+                for line in f:
+                    if needle not in line:
+                        continue
+                    try:
+                        execution = PipelineExecution.model_validate_json(line)
+                    except Exception as e:
+                        print(f"Error loading {log_path}: {e}")
+                        continue
+                    if execution.execution_id == execution_id:
+                        return execution
+        
+        legacy_file = self.metrics_dir / f"{execution_id}.json"
+        if legacy_file.exists():
+            return self._load_execution_file(legacy_file)
+        return None
+    
+    def generate_history_report(self) -> str:
+        """Generate a metrics report over every stored execution, aggregated via the rollup"""
+        return self.generate_metrics_report(self.load_all_executions(), use_rollup=True)
+    
     def load_all_executions(self) -> List[PipelineExecution]:
         """Load all execution records from metrics directory"""
-        executions = []
-        
-        for file in self.metrics_dir.glob("exec_*.json"):
-            try:
-                with open(file, 'r') as f:
-                    data = json.load(f)
-                execution = PipelineExecution.model_validate(data)
-                executions.append(execution)
-            except Exception as e:
-                print(f"Error loading {file}: {e}")
+        # Executions in the rolling log are read in one sequential pass
+        logged = self._load_execution_log(self.metrics_dir / EXECUTION_LOG)
+        executions = list(logged.values())
+        # Legacy exec_*.json files are folded into the log the first time they are seen
+        executions.extend(self._import_execution_files(logged))
+        
+        label_cache: Dict[Tuple[Tuple[str, str], ...], FrozenLabels] = {}
+        for execution in executions:
+            self._intern_labels(execution, label_cache)
                 
         return sorted(executions, key=lambda e: e.start_time)
     
+    def import_execution_files(self) -> int:
+        """
+        Fold legacy per-execution exec_*.json files into the rolling log
+        
+        Files whose execution is already logged are skipped; the files
+        themselves are left in place. Returns the number of records imported.
+        """
+        logged = self._load_execution_log(self.metrics_dir / EXECUTION_LOG)
+        return len(self._import_execution_files(logged))
+    
+    def _import_execution_files(self, logged: Dict[str, PipelineExecution],
+                                max_workers: int = 16) -> List[PipelineExecution]:
+        """Append legacy exec_*.json records missing from the log and return them"""
+        files = [f for f in self.metrics_dir.glob("exec_*.json") if f.stem not in logged]
+        if not files:
+            return []
+        
+        # File reads release the GIL, so load records concurrently
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(files))) as executor:
+            loaded = [execution for execution in executor.map(self._load_execution_file, files)
+                      if execution is not None and execution.execution_id not in logged]
+        
+        loaded.sort(key=lambda e: e.start_time)
+        for execution in loaded:
+            self.append_execution(execution)
+        return loaded
+    
+    @staticmethod
+    def _intern_labels(execution: PipelineExecution,
+                       cache: Dict[Tuple[Tuple[str, str], ...], FrozenLabels]):
+        """Point metrics with identical labels at one shared, read-only dict.
+
+        Most metrics carry one of a handful of label sets. The cache only
+        lives for one load_all_executions call.
+        """
+        for metric in execution.metrics:
+            labels = metric.labels
+            key = tuple(sorted(labels.items()))
+            shared = cache.get(key)
+            if shared is None:
+                shared = cache[key] = FrozenLabels(labels)
+            metric.labels = shared
+    
+    @staticmethod
+    def _load_execution_log(log_path: Path) -> Dict[str, PipelineExecution]:
+        """Load executions from the rolling log, keyed by execution id"""
+        executions: Dict[str, PipelineExecution] = {}
+        if not log_path.exists():
+            return executions
+        
+        with open(log_path, 'rb') as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    execution = PipelineExecution.model_validate_json(line)
+                    executions[execution.execution_id] = execution
+                except Exception as e:
+                    print(f"Error loading {log_path}:{line_no}: {e}")
+        return executions
+    
+    @staticmethod
+    def _load_execution_file(file: Path) -> Optional[PipelineExecution]:
+        """Load a single execution record, returning None if it cannot be parsed"""
+        try:
+            # Decode and validate in one step, without an intermediate dict
+            return PipelineExecution.model_validate_json(file.read_bytes())
+        except Exception as e:
+            print(f"Error loading {file}: {e}")
+            return None
+    
     def get_metrics_by_stage(self, executions: List[PipelineExecution]) -> Dict[str, Dict[str, Any]]:
         """Group metrics by pipeline stage"""
         stage_metrics = defaultdict(list)
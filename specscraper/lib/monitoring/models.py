@@ -1,8 +1,10 @@
 """Core monitoring data structures for pipeline execution tracking"""
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import List, Dict, Optional
-from enum import Enum
+from typing import List, Dict, Optional, Sequence
+from enum import Enum, IntEnum
+from operator import attrgetter
+import numpy as np
 
 
 class PipelineStage(str, Enum):
@@ -31,6 +33,49 @@ class ErrorCategory(str, Enum):
     UNKNOWN_ERROR = "unknown_error"
 
 
+# Ordinal codes for numpy counting (np.bincount). The enums stay str-valued
+# because their values are what execution JSON stores.
+ERROR_CATEGORIES = tuple(ErrorCategory)
+ERROR_CATEGORY_CODES = {category: code for code, category in enumerate(ERROR_CATEGORIES)}
+PIPELINE_STAGES = tuple(PipelineStage)
+PIPELINE_STAGE_CODES = {stage: code for code, stage in enumerate(PIPELINE_STAGES)}
+
+
+class CounterIdx(IntEnum):
+    """Position of each PipelineExecution counter in its counter vector"""
+    SUCCESSFUL_SCRAPES = 0
+    FAILED_SCRAPES = 1
+    SUCCESSFUL_LLM_CALLS = 2
+    FAILED_LLM_CALLS = 3
+    BOT_DETECTIONS = 4
+    RATE_LIMIT_ERRORS = 5
+    NETWORK_ERRORS = 6
+    VALIDATION_ERRORS = 7
+
+
+# Reads every counter field of an execution in CounterIdx order
+_counter_values = attrgetter(*(idx.name.lower() for idx in CounterIdx))
+
+
+class FrozenLabels(dict):
+    """
+    Read-only label dict shared between metrics with identical labels
+
+    Still a dict, so pydantic serializes it as-is; to change labels assign
+    a new dict, e.g. metric.labels = {**metric.labels, "key": "value"}.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("FrozenLabels is read-only; assign a new labels dict instead")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        # Rebuild from a plain dict so copy/deepcopy/pickle skip __setitem__
+        return (FrozenLabels, (dict(self),))
+
+
 class PipelineMetric(BaseModel):
     """Single metric measurement"""
     name: str = Field(description="Name of the metric")
@@ -79,6 +124,10 @@ class PipelineExecution(BaseModel):
     metrics: List[PipelineMetric] = Field(default_factory=list, description="All metrics collected")
     errors: List[PipelineError] = Field(default_factory=list, description="All errors encountered")
     
+    def counter_vector(self) -> np.ndarray:
+        """Counter fields as an int64 vector indexed by CounterIdx"""
+        return np.array(_counter_values(self), dtype=np.int64)
+    
     # Computed properties
     @property
     def duration(self) -> Optional[float]:
@@ -101,4 +150,11 @@ class PipelineExecution(BaseModel):
         total_llm_calls = self.successful_llm_calls + self.failed_llm_calls
         if total_llm_calls == 0:
             return 0.0
-        return self.successful_llm_calls / total_llm_calls
\ No newline at end of file
+        return self.successful_llm_calls / total_llm_calls
+
+
+def counter_matrix(executions: Sequence[PipelineExecution]) -> np.ndarray:
+    """Counters of many executions as one int64 matrix (row per execution, CounterIdx columns)"""
+    return np.array(
+        [_counter_values(execution) for execution in executions], dtype=np.int64
+    ).reshape(len(executions), len(CounterIdx))
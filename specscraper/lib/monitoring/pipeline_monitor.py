@@ -1,15 +1,18 @@
 """Pipeline monitoring system for tracking execution and collecting metrics"""
-import json
 import logging
 import os
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping
+import numpy as np
 from ..core.scraping import ScrapeResult, PageIssue
 from .models import (
     PipelineExecution, PipelineMetric, PipelineError, 
     PipelineStage, MetricType, ErrorCategory
 )
+from .metrics_collector import MetricsCollector
 
 logger = logging.getLogger(__name__)
 
@@ -17,11 +20,20 @@ logger = logging.getLogger(__name__)
 class PipelineMonitor:
     """Monitors pipeline execution and collects metrics"""
     
+    # Seconds an unchanged get_current_stats() result may be reused
+    STATS_CACHE_TTL = 0.1
+    
     def __init__(self, metrics_dir: str = "data/metrics"):
         self.metrics_dir = Path(metrics_dir)
         self.metrics_dir.mkdir(exist_ok=True, parents=True)
+        self.collector = MetricsCollector(metrics_dir=metrics_dir)
         self.current_execution: Optional[PipelineExecution] = None
         self.executions: List[PipelineExecution] = []
+        # Bumped by every record_* call; keys the stats cache
+        self._stats_version = 0
+        self._stats_cache: Optional[Mapping[str, Any]] = None
+        self._stats_cache_key: Optional[tuple] = None
+        self._stats_cache_ts = 0.0
         
     def start_execution(self, total_urls: int) -> str:
         """Start a new pipeline execution"""
@@ -91,70 +103,90 @@ class PipelineMonitor:
     
     def record_scrape_result(self, result: ScrapeResult, stage: PipelineStage = PipelineStage.SCRAPING):
         """Record metrics from a scrape result"""
+        self.record_scrape_results([result], stage=stage)
+    
+    def record_scrape_results(self, results: List[ScrapeResult], stage: PipelineStage = PipelineStage.SCRAPING):
+        """
+        Record metrics from a batch of scrape results
+        
+        Per-result metrics and errors are appended in input order; the
+        execution counters are computed for the whole batch and applied once.
+        """
         if not self.current_execution:
             logger.warning("No active execution - cannot record scrape result")
             return
-            
-        # Update counters
-        # Always record scraping method count
-        self.record_metric(
-            name="scrape.method",
-            value=1,
-            metric_type=MetricType.COUNTER,
-            stage=stage,
-            labels={"method": result.final_method.value}
-        )
+        if not results:
+            return
         
-        if result.success:
-            self.current_execution.successful_scrapes += 1
-            self.record_metric(
-                name="scrape.success",
-                value=1,
-                metric_type=MetricType.COUNTER,
-                stage=stage,
-                labels={
-                    "method": result.final_method.value,
-                    "status_code": str(result.status_code or "none")
-                }
-            )
-        else:
-            self.current_execution.failed_scrapes += 1
+        success = np.fromiter((result.success for result in results), dtype=bool, count=len(results))
+        failed = [result for result, ok in zip(results, success) if not ok]
+        
+        for result, ok in zip(results, success):
+            method = result.final_method.value
+            
+            # Always record scraping method count
             self.record_metric(
-                name="scrape.failure",
+                name="scrape.method",
                 value=1,
                 metric_type=MetricType.COUNTER,
                 stage=stage,
-                labels={
-                    "method": result.final_method.value,
-                    "error_reason": result.error_reason or "unknown"
-                }
+                labels={"method": method}
             )
             
-            # Categorize and record error
-            error_category = self._categorize_scrape_error(result)
-            self.record_error(
-                category=error_category,
-                stage=stage,
-                url=result.url,
-                error_message=result.error_reason or "Unknown error",
-                additional_info={"scraping_method": result.final_method.value}
-            )
-            
-            # Update specific error counters
-            if PageIssue.BOT_DETECTED in result.page_issues:
-                self.current_execution.bot_detections += 1
-            if PageIssue.TIMEOUT in result.page_issues:
-                self.current_execution.network_errors += 1
+            if ok:
+                self.record_metric(
+                    name="scrape.success",
+                    value=1,
+                    metric_type=MetricType.COUNTER,
+                    stage=stage,
+                    labels={
+                        "method": method,
+                        "status_code": str(result.status_code or "none")
+                    }
+                )
+            else:
+                self.record_metric(
+                    name="scrape.failure",
+                    value=1,
+                    metric_type=MetricType.COUNTER,
+                    stage=stage,
+                    labels={
+                        "method": method,
+                        "error_reason": result.error_reason or "unknown"
+                    }
+                )
                 
-        # Record scrape time
-        if result.scrape_time > 0:
-            self.record_metric(
-                name="scrape.duration_seconds",
-                value=result.scrape_time,
-                metric_type=MetricType.HISTOGRAM,
-                stage=stage,
-                labels={"method": result.final_method.value}
-            )
+                # Categorize and record error
+                error_category = self._categorize_scrape_error(result)
+                self.record_error(
+                    category=error_category,
+                    stage=stage,
+                    url=result.url,
+                    error_message=result.error_reason or "Unknown error",
+                    additional_info={"scraping_method": method}
+                )
+            
+            # Record scrape time
+            if result.scrape_time > 0:
+                self.record_metric(
+                    name="scrape.duration_seconds",
+                    value=result.scrape_time,
+                    metric_type=MetricType.HISTOGRAM,
+                    stage=stage,
+                    labels={"method": method}
+                )
+        
+        # Apply the batch's counter deltas in one update
+        self._stats_version += 1
+        successful = int(np.count_nonzero(success))
+        self.current_execution.successful_scrapes += successful
+        self.current_execution.failed_scrapes += len(results) - successful
+        self.current_execution.bot_detections += sum(
+            PageIssue.BOT_DETECTED in result.page_issues for result in failed
+        )
+        self.current_execution.network_errors += sum(
+            PageIssue.TIMEOUT in result.page_issues for result in failed
+        )
     
     def record_llm_result(self, success: bool, model: str, error: Optional[str] = None, 
                          tokens_used: int = 0, cost: float = 0.0):
@@ -164,6 +196,7 @@ class PipelineMonitor:
             return
             
         stage = PipelineStage.LLM_EXTRACTION
+        self._stats_version += 1
         
         if success:
             self.current_execution.successful_llm_calls += 1
@@ -224,6 +257,7 @@ class PipelineMonitor:
         """Record a generic metric"""
         if not self.current_execution:
             return
+        self._stats_version += 1
             
         metric = PipelineMetric(
             name=name,
@@ -243,6 +277,7 @@ class PipelineMonitor:
         """Record an error that occurred during execution"""
         if not self.current_execution:
             return
+        self._stats_version += 1
             
         error = PipelineError(
             category=category,
@@ -255,11 +290,38 @@ class PipelineMonitor:
         
         logger.error(f"Pipeline error: {category.value} at {stage.value} - {error_message}")
     
-    def get_current_stats(self) -> Optional[Dict[str, Any]]:
-        """Get current execution statistics"""
+    def get_current_stats(self) -> Optional[Mapping[str, Any]]:
+        """
+        Get current execution statistics
+        
+        Polling is cheap: the stats are rebuilt only after a record_* call or
+        once they are older than STATS_CACHE_TTL. The snapshot is shared
+        between callers and read-only (nested sections included); copy it
+        with dict() to modify. Code that mutates current_execution directly
+        should call invalidate_stats_cache() afterwards.
+        """
         if not self.current_execution:
             return None
-            
+        
+        now = time.monotonic()
+        key = (id(self.current_execution), self._stats_version)
+        if key != self._stats_cache_key or now - self._stats_cache_ts >= self.STATS_CACHE_TTL:
+            stats = self._build_current_stats()
+            self._stats_cache = MappingProxyType({
+                name: MappingProxyType(value) if isinstance(value, dict) else value
+                for name, value in stats.items()
+            })
+            self._stats_cache_key = key
+            self._stats_cache_ts = now
+        
+        return self._stats_cache
+    
+    def invalidate_stats_cache(self):
+        """Force the next get_current_stats() call to rebuild the statistics"""
+        self._stats_version += 1
+    
+    def _build_current_stats(self) -> Dict[str, Any]:
+        """Build the statistics dict for the current execution"""
         return {
             "execution_id": self.current_execution.execution_id,
             "start_time": self.current_execution.start_time.isoformat(),
@@ -325,18 +387,11 @@ class PipelineMonitor:
             return ErrorCategory.UNKNOWN_ERROR
     
     def _save_execution(self, execution: PipelineExecution):
-        """Save execution data to file"""
-        filename = self.metrics_dir / f"{execution.execution_id}.json"
-        with open(filename, 'w') as f:
-            json.dump(execution.model_dump(mode='json'), f, indent=2, default=str)
-        logger.info(f"Saved execution metrics to {filename}")
+        """Save execution data to the rolling execution log and fold it into the rollup"""
+        self.collector.append_execution(execution)
+        self.collector.update_rollup([execution])
+        logger.info(f"Saved execution metrics for {execution.execution_id} to {self.metrics_dir}")
     
     def load_execution(self, execution_id: str) -> Optional[PipelineExecution]:
-        """Load a previous execution from file"""
-        filename = self.metrics_dir / f"{execution_id}.json"
-        if not filename.exists():
-            return None
-            
-        with open(filename, 'r') as f:
-            data = json.load(f)
-        return PipelineExecution.model_validate(data)
\ No newline at end of file
+        """Load a previous execution from the rolling execution log"""
+        return self.collector.load_execution(execution_id)
\ No newline at end of file
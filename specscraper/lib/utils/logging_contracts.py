@@ -5,14 +5,21 @@ This module defines the core protocols and types for deterministic,
 ordered event emission with strict I/O separation guarantees.
 """
 
+import itertools
 import json
+import sys
 import time
 import threading
 import atexit
 import re
 import logging
 from typing import Protocol, Literal, Any, Dict, Optional
-from datetime import datetime, timezone
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 Level = Literal["debug", "info", "warn", "error"]
@@ -30,7 +37,7 @@ class TokenBucketRateLimiter:
         self.bucket_size = bucket_size
         self.refill_rate = refill_rate
         self.tokens = float(bucket_size)
-        self.last_refill = time.time()
+        self.last_refill = time.monotonic()
         self.suppressed_count = 0
         self.lock = threading.Lock()
 
@@ -45,24 +52,22 @@ class TokenBucketRateLimiter:
         if level == "error":
             return True
 
+        # Refill and take a token under one lock so the cap holds under contention
         with self.lock:
-            now = time.time()
+            now = time.monotonic()
 
             # Refill tokens based on elapsed time
-            elapsed = now - self.last_refill
-            self.tokens = min(
-                self.bucket_size,
-                self.tokens + elapsed * self.refill_rate
-            )
+            tokens = self.tokens + (now - self.last_refill) * self.refill_rate
             self.last_refill = now
 
             # Check if we have tokens available
-            if self.tokens >= 1.0:
-                self.tokens -= 1.0
+            if tokens >= 1.0:
+                self.tokens = min(tokens, self.bucket_size) - 1.0
                 return True
-            else:
-                self.suppressed_count += 1
-                return False
+
+            self.tokens = tokens
+            self.suppressed_count += 1
+            return False
 
     def get_suppressed_count(self) -> int:
         """Get count of suppressed events and reset counter."""
@@ -72,6 +77,103 @@ class TokenBucketRateLimiter:
             return count
 
 
+# Redaction patterns for plain text, applied in order by PIIRedactor.redact()
+_PII_TEXT_PATTERNS = (
+    # URLs with authentication (user:pass@host) - must come before email
+    (re.compile(r'https?://[^:/\s]+:[^@/\s]+@[^\s]+'), '[AUTH_URL]'),
+
+    # Email addresses
+    (re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'), '[EMAIL]'),
+
+    # URL query parameters with sensitive data
+    (re.compile(r'([?&])(token|key|secret|auth)=[^&\s]+'), r'\1\2=[REDACTED]'),
+
+    # API keys and tokens (common patterns)
+    (re.compile(r'\b(sk-[a-zA-Z0-9]{10,}|pk_[a-zA-Z0-9_]{10,})\b'), '[API_KEY]'),
+
+    # Common secret patterns - any long alphanumeric string
+    (re.compile(r'\b[A-Za-z0-9]{32,}\b'), '[TOKEN]'),
+)
+
+# The same patterns for serialized event lines, in priority order. They are
+# fused into a single alternation so a line is scanned once; at any position
+# the first alternative that matches wins, mirroring the sequential order.
+#
+# These run over serialized JSON lines, so the patterns must never
+# break JSON: backslash escapes are consumed whole by the leading
+# 'escape' alternative (and left untouched), patterns never match a bare
+# quote and only cross a backslash as part of a complete escape, a match
+# may begin right after an escape such as \n the way it would after a
+# real newline, and long tokens must contain a letter so bare JSON
+# numbers are never replaced. Digit-only tokens get a second pass that is
+# limited to JSON string literals (_PII_DIGIT_TOKEN below).
+_AFTER_ESCAPE = r'(?<=\\[nrtbf])|(?<=\\u[0-9a-fA-F]{4})'
+_ESCAPED_CHAR = r'\\(?:u[0-9a-fA-F]{4}|["\\/b])'
+_PII_PATTERNS = (
+    # JSON string escapes (\n, \", \\, \u00e9, ...) - kept verbatim
+    ('escape', r'\\(?:u[0-9a-fA-F]{4}|.)'),
+
+    # URLs with authentication (user:pass@host) - must come before email
+    ('auth_url', rf'https?://(?:[^:/\s"\\]|{_ESCAPED_CHAR})+:(?:[^@/\s"\\]|{_ESCAPED_CHAR})+@(?:[^\s"\\]|{_ESCAPED_CHAR})+'),
+
+    # Email addresses
+    ('email', rf'(?:\b|{_AFTER_ESCAPE})[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{{2,}}\b'),
+
+    # URL query parameters with sensitive data
+    ('query_param', rf'(?P<query_prefix>[?&](?:token|key|secret|auth)=)(?:[^&\s"\\]|{_ESCAPED_CHAR})+'),
+
+    # API keys and tokens (common patterns)
+    ('api_key', rf'(?:\b|{_AFTER_ESCAPE})(?:sk-[a-zA-Z0-9]{{10,}}|pk_[a-zA-Z0-9_]{{10,}})\b'),
+
+    # Common secret patterns - any long alphanumeric string
+    ('token', rf'(?:\b|{_AFTER_ESCAPE})(?=[0-9]*[A-Za-z])[A-Za-z0-9]{{32,}}\b'),
+)
+
+_PII_COMBINED = re.compile(
+    '|'.join(f'(?P<{name}>{pattern})' for name, pattern in _PII_PATTERNS),
+    re.DOTALL
+)
+
+# Prefilters: every pattern except 'token' needs one of these literals, and
+# 'token' needs a 32+ character alphanumeric run. Text failing both probes
+# cannot contain PII, and text failing only the first can be scanned with
+# the much cheaper escape/token subset of the alternation.
+_PII_TRIGGERS = ('@', '=', 'sk-', 'pk_')
+_PII_LONG_RUN = re.compile(r'[A-Za-z0-9]{32}')
+_PII_TOKEN_ONLY = re.compile(
+    '|'.join(f'(?P<{name}>{pattern})' for name, pattern in _PII_PATTERNS
+             if name in ('escape', 'token')),
+    re.DOTALL
+)
+
+# Digit-only secrets (32+ digits) inside string values; bare numbers are skipped
+_PII_DIGIT_RUN = re.compile(r'[0-9]{32}')
+_JSON_STRING = re.compile(r'"(?:[^"\\]|\\.)*"')
+_PII_DIGIT_TOKEN = re.compile(rf'(?:\b|{_AFTER_ESCAPE})[0-9]{{32,}}\b')
+
+_PII_REPLACEMENTS = {
+    'auth_url': '[AUTH_URL]',
+    'email': '[EMAIL]',
+    'api_key': '[API_KEY]',
+    'token': '[TOKEN]',
+}
+
+
+def _redact_digit_tokens(match: 're.Match[str]') -> str:
+    """Replace digit-only tokens within one JSON string literal."""
+    return _PII_DIGIT_TOKEN.sub('[TOKEN]', match.group())
+
+
+def _pii_replace(match: 're.Match[str]') -> str:
+    """Replacement callback for the combined redaction pattern."""
+    kind = match.lastgroup
+    if kind == 'escape':
+        return match.group()
+    if kind == 'query_param':
+        return match.group('query_prefix') + '[REDACTED]'
+    return _PII_REPLACEMENTS[kind]
+
+
 class PIIRedactor:
     """
     Redacts personally identifiable information and sensitive data from log messages.
@@ -80,32 +182,26 @@ class PIIRedactor:
     """
 
     def __init__(self):
-        self.patterns = [
-            # URLs with authentication (user:pass@host) - must come before email
-            (re.compile(r'https?://[^:/\s]+:[^@/\s]+@[^\s]+'), '[AUTH_URL]'),
-
-            # Email addresses
-            (re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'), '[EMAIL]'),
-
-            # URL query parameters with sensitive data
-            (re.compile(r'([?&])(token|key|secret|auth)=[^&\s]+'), r'\1\2=[REDACTED]'),
-
-            # API keys and tokens (common patterns)
-            (re.compile(r'\b(sk-[a-zA-Z0-9]{10,}|pk_[a-zA-Z0-9_]{10,})\b'), '[API_KEY]'),
-
-            # Common secret patterns - any long alphanumeric string
-            (re.compile(r'\b[A-Za-z0-9]{32,}\b'), '[TOKEN]'),
-        ]
+        self.patterns = list(_PII_TEXT_PATTERNS)
 
     def redact(self, text: str) -> str:
         """Apply redaction patterns to text."""
         for pattern, replacement in self.patterns:
-            if callable(replacement):
-                text = pattern.sub(replacement, text)
-            else:
-                text = pattern.sub(replacement, text)
+            text = pattern.sub(replacement, text)
         return text
 
+    def _redact_json_line(self, line: str) -> str:
+        """Redact a serialized event line in one pass, leaving JSON escapes intact."""
+        if any(trigger in line for trigger in _PII_TRIGGERS):
+            line = _PII_COMBINED.sub(_pii_replace, line)
+        elif _PII_LONG_RUN.search(line) is None:
+            return line
+        else:
+            line = _PII_TOKEN_ONLY.sub(_pii_replace, line)
+        if _PII_DIGIT_RUN.search(line) is not None:
+            line = _JSON_STRING.sub(_redact_digit_tokens, line)
+        return line
+
     def redact_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Recursively redact dictionary values."""
         redacted = {}
@@ -160,6 +256,65 @@ class EventSchema:
         return cls.LEVELS[event_level] >= cls.LEVELS[min_level]
 
 
+# Numeric levels for the emitter and Logger fast paths
+_LEVEL_NUMS = EventSchema.LEVELS
+_DEBUG = EventSchema.LEVELS["debug"]
+_INFO = EventSchema.LEVELS["info"]
+_WARN = EventSchema.LEVELS["warn"]
+_ERROR = EventSchema.LEVELS["error"]
+
+
+# JSON helpers shared by all events: the string escaper json.dumps uses for
+# str values, and one reusable compact encoder (repr for unknown objects)
+_json_str = json.encoder.encode_basestring_ascii
+_stdlib_json_encode = json.JSONEncoder(default=repr, separators=(',', ':')).encode
+
+if ORJSON_AVAILABLE:
+    _ORJSON_SCALARS = frozenset({str, int, bool, type(None)})
+
+    def _orjson_exact(obj: Any) -> bool:
+        """
+        Check that orjson would encode obj exactly like the json encoder.
+
+        Only exact builtin containers with str keys and JSON scalars qualify.
+        Anything else (datetimes, enums, UUIDs, dataclasses, non-str keys,
+        subclasses) goes through json so unknown objects still become their
+        repr. Floats must be finite and in the range where repr() uses plain
+        notation, since orjson writes exponents differently (1e16 vs 1e+16).
+        """
+        t = type(obj)
+        if t in _ORJSON_SCALARS:
+            return True
+        if t is float:
+            return obj == 0.0 or 1e-4 <= abs(obj) < 1e16
+        if t is dict:
+            for key, value in obj.items():
+                if type(key) is not str or not _orjson_exact(value):
+                    return False
+            return True
+        if t is list or t is tuple:
+            for value in obj:
+                if not _orjson_exact(value):
+                    return False
+            return True
+        return False
+
+    def _json_encode(obj: Any) -> str:
+        """Encode with orjson when its output is identical to json's, else with json."""
+        if _orjson_exact(obj):
+            try:
+                data = orjson.dumps(obj)
+            except TypeError:
+                # e.g. integers wider than 64 bits or very deep nesting
+                return _stdlib_json_encode(obj)
+            # orjson emits raw UTF-8; keep event lines ASCII-only like json does
+            if data.isascii():
+                return data.decode()
+        return _stdlib_json_encode(obj)
+else:
+    _json_encode = _stdlib_json_encode
+
+
 class Event:
     """Represents a single structured log event."""
 
@@ -172,7 +327,9 @@ class Event:
         event_id: int,
         timestamp: str,
         schema: str = EventSchema.VERSION,
-        ctx: Optional[Dict[str, Any]] = None
+        ctx: Optional[Dict[str, Any]] = None,
+        json_schema: Optional[str] = None,
+        json_component: Optional[str] = None
     ):
         self.level = level
         self.component = component
@@ -181,35 +338,42 @@ class Event:
         self.timestamp = timestamp
         self.schema = schema
         self.ctx = ctx or {}
+        # Pre-encoded JSON strings for schema/component, if the caller has them
+        self._json_schema = json_schema
+        self._json_component = json_component
 
     def to_json_line(self, redactor: Optional['PIIRedactor'] = None) -> str:
         """Convert event to JSON line format with optional PII redaction."""
-        data = {
-            "schema": self.schema,
-            "ts": self.timestamp,
-            "event_id": self.event_id,
-            "level": self.level,
-            "component": self.component,
-            "message": self.message
-        }
-
-        # Add context if present
+        # The top-level fields have a fixed shape, so only the string fields
+        # need JSON escaping; schema/component may arrive pre-encoded
+        json_schema = self._json_schema or _json_str(self.schema)
+        json_component = self._json_component or _json_str(self.component)
+        # Messages are normally str; anything else (None, ints, exceptions)
+        # goes through the general encoder, as json.dumps(default=repr) did
+        message = self.message
+        json_message = _json_str(message) if type(message) is str else _json_encode(message)
+        line = (
+            f'{{"schema":{json_schema},"ts":"{self.timestamp}",'
+            f'"event_id":{self.event_id},"level":"{self.level}",'
+            f'"component":{json_component},"message":{json_message}'
+        )
         if self.ctx:
-            data["ctx"] = self.ctx
+            # Use repr as default to handle non-serializable objects
+            line = f'{line},"ctx":{_json_encode(self.ctx)}}}'
+        else:
+            line += '}'
 
-        # Apply PII redaction if configured
+        # Apply PII redaction if configured - one pass over the whole line
         if redactor:
-            data["message"] = redactor.redact(data["message"])
-            if "ctx" in data:
-                data["ctx"] = redactor.redact_dict(data["ctx"])
-
-        # Use repr as default to handle non-serializable objects
-        return json.dumps(data, default=repr, separators=(',', ':'))
+            line = redactor._redact_json_line(line)
+        return line
 
 
 class EventEmitter:
     """Thread-safe event emission with ordering guarantees and rate limiting."""
 
+    SUPPRESSION_CHECK_INTERVAL = 64
+
     def __init__(
         self,
         sink: Sink,
@@ -219,23 +383,30 @@ class EventEmitter:
     ):
         self.sink = sink
         self.min_level = min_level
+        self._min_level_num = EventSchema.LEVELS[min_level]
         self.rate_limiter = rate_limiter
         self.redactor = redactor
-        self._event_counter = 0
+        # count().__next__ is atomic under the GIL, so IDs need no lock
+        self._event_ids = itertools.count(1)
         self._lock = threading.Lock()
         self._start_time = time.time()
         self._last_suppression_report = time.time()
         self._shutdown_registered = False
+        self._ts_second_cache = (-1, "")
 
     def _next_event_id(self) -> int:
         """Get next monotonic event ID."""
-        with self._lock:
-            self._event_counter += 1
-            return self._event_counter
+        return next(self._event_ids)
 
     def _current_timestamp(self) -> str:
-        """Get current timestamp in ISO8601 UTC format."""
-        return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        """Get current timestamp in ISO8601 UTC format (microsecond precision)."""
+        seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+        # The date/time prefix only changes once a second; reuse it in bursts
+        cached_second, prefix = self._ts_second_cache
+        if seconds != cached_second:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))
+            self._ts_second_cache = (seconds, prefix)
+        return f"{prefix}.{nanos // 1000:06d}Z"
 
     def _create_suppression_event(self, suppressed_count: int) -> Event:
         """Create an event reporting suppressed message count."""
@@ -256,7 +427,6 @@ class EventEmitter:
         except Exception:
             # If primary sink fails, try stderr as fallback
             try:
-                import sys
                 sys.stderr.write(f"LOG_SINK_ERROR: {line}")
                 sys.stderr.flush()
             except Exception:
@@ -266,23 +436,82 @@ class EventEmitter:
 
     def emit(self, event: Event) -> None:
         """Emit an event if it meets level and rate limit thresholds."""
-        if not EventSchema.should_emit(event.level, self.min_level):
+        if _LEVEL_NUMS[event.level] < self._min_level_num:
             return
 
         # Check rate limiting
-        if self.rate_limiter and not self.rate_limiter.should_emit(event.level):
-            # Event was suppressed - maybe emit suppression report
-            now = time.time()
-            if now - self._last_suppression_report >= 10.0:  # Report every 10 seconds
-                suppressed = self.rate_limiter.get_suppressed_count()
-                if suppressed > 0:
-                    suppression_event = self._create_suppression_event(suppressed)
-                    self._emit_internal(suppression_event)
-                    self._last_suppression_report = now
-            return
+        if self.rate_limiter:
+            if not self.rate_limiter.should_emit(event.level):
+                self._maybe_report_suppression()
+                return
+            # Report suppressed events still pending from earlier bursts
+            if self.rate_limiter.suppressed_count:
+                self._report_suppression_if_due()
 
         self._emit_internal(event)
 
+    def emit_fields(
+        self,
+        level: Level,
+        component: str,
+        message: str,
+        schema: str = EventSchema.VERSION,
+        ctx: Optional[Dict[str, Any]] = None,
+        json_schema: Optional[str] = None,
+        json_component: Optional[str] = None
+    ) -> None:
+        """
+        Build and emit an event from its fields.
+
+        The event ID, timestamp and write all happen in one critical
+        section, so IDs and timestamps are assigned in write order and
+        filtered events do not consume IDs. json_schema/json_component
+        are optional pre-encoded JSON strings for schema and component.
+        """
+        if _LEVEL_NUMS[level] < self._min_level_num:
+            return
+
+        if self.rate_limiter:
+            if not self.rate_limiter.should_emit(level):
+                self._maybe_report_suppression()
+                return
+            # Report suppressed events still pending from earlier bursts
+            if self.rate_limiter.suppressed_count:
+                self._report_suppression_if_due()
+
+        with self._lock:
+            event = Event(
+                level=level,
+                component=component,
+                message=message,
+                event_id=next(self._event_ids),
+                timestamp=self._current_timestamp(),
+                schema=schema,
+                ctx=ctx,
+                json_schema=json_schema,
+                json_component=json_component
+            )
+            self._safe_write(event.to_json_line(self.redactor) + "\n")
+
+    def _maybe_report_suppression(self) -> None:
+        """After a suppressed event, emit a suppression report if one is due."""
+        # Only look at the clock on the first suppressed event after a report
+        # and then once every SUPPRESSION_CHECK_INTERVAL events; the allow
+        # path in emit()/emit_fields() covers sparse suppression
+        if self.rate_limiter.suppressed_count % self.SUPPRESSION_CHECK_INTERVAL != 1:
+            return
+        self._report_suppression_if_due()
+
+    def _report_suppression_if_due(self) -> None:
+        """Emit a suppression report if the reporting interval has passed."""
+        now = time.time()
+        if now - self._last_suppression_report >= 10.0:  # Report every 10 seconds
+            suppressed = self.rate_limiter.get_suppressed_count()
+            if suppressed > 0:
+                suppression_event = self._create_suppression_event(suppressed)
+                self._emit_internal(suppression_event)
+                self._last_suppression_report = now
+
     def _emit_internal(self, event: Event) -> None:
         """Internal emission with atomic write."""
         # Atomic write with lock to ensure line integrity
@@ -355,6 +584,12 @@ class Logger:
         self.component = component
         self.schema = schema
         self._emitter = EventEmitter(sink, level, rate_limiter, redactor)
+        # Filtered calls return on one int compare, before ctx is used
+        self._min_level_num = EventSchema.LEVELS[level]
+
+        # schema/component never change, so JSON-encode them once up front
+        self._json_schema = _json_str(schema)
+        self._json_component = _json_str(component)
 
         # Register graceful shutdown by default
         if auto_shutdown:
@@ -362,31 +597,37 @@ class Logger:
 
     def _log(self, level: Level, message: str, **ctx: Any) -> None:
         """Internal logging method."""
-        event = Event(
-            level=level,
-            component=self.component,
-            message=message,
-            event_id=self._emitter._next_event_id(),
-            timestamp=self._emitter._current_timestamp(),
-            schema=self.schema,
-            ctx=ctx if ctx else None
+        self._log_with_ctx(level, message, ctx or None)
+
+    def _log_with_ctx(self, level: Level, message: str, ctx: Optional[Dict[str, Any]]) -> None:
+        """Internal logging method taking a prebuilt ctx dict (no kwargs repacking)."""
+        self._emitter.emit_fields(
+            level, self.component, message, self.schema, ctx,
+            self._json_schema, self._json_component
         )
-        self._emitter.emit(event)
 
     def debug(self, message: str, **ctx: Any) -> None:
         """Emit debug level event."""
+        if _DEBUG < self._min_level_num:
+            return
         self._log("debug", message, **ctx)
 
     def info(self, message: str, **ctx: Any) -> None:
         """Emit info level event."""
+        if _INFO < self._min_level_num:
+            return
         self._log("info", message, **ctx)
 
     def warn(self, message: str, **ctx: Any) -> None:
         """Emit warning level event."""
+        if _WARN < self._min_level_num:
+            return
         self._log("warn", message, **ctx)
 
     def error(self, message: str, **ctx: Any) -> None:
         """Emit error level event."""
+        if _ERROR < self._min_level_num:
+            return
         self._log("error", message, **ctx)
 
     def progress(self, stage: str, progress: float, message: str, **extra_ctx: Any) -> None:
@@ -396,6 +637,8 @@ class Logger:
         Progress events are regular log events with ctx.type="progress".
         This allows upstream to filter them deterministically.
         """
+        if _INFO < self._min_level_num:
+            return
         ctx = {
             "type": "progress",
             "stage": stage,
@@ -424,19 +667,19 @@ class MemorySink:
 
     def get_events(self) -> list[Dict[str, Any]]:
         """Parse all written lines as JSON events."""
-        events = []
-        for line in self.lines:
-            if line.strip():
-                events.append(json.loads(line.strip()))
-        return events
+        # One parse of a JSON array beats a json.loads call per line; the
+        # trailing newlines are plain JSON whitespace
+        payload = ",".join(line for line in self.lines if line and not line.isspace())
+        return json.loads(f"[{payload}]")
 
 
 class FileSink:
     """File-based sink."""
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, buffer_size: int = 64 * 1024):
         self.file_path = file_path
-        self._file = open(file_path, 'w')
+        # A large write buffer lets many small lines share one write syscall
+        self._file = open(file_path, 'w', buffering=buffer_size)
 
     def write(self, s: str) -> None:
         self._file.write(s)
@@ -454,6 +697,86 @@ class FileSink:
         self.close()
 
 
+class BatchedFileSink:
+    """
+    File-based sink that coalesces lines into large writes.
+
+    Lines are queued in memory and written with a single write() once
+    max_batch_bytes or max_batch_entries is reached. A background thread
+    writes any partial batch every flush_interval seconds, so quiet periods
+    never hold events back for long. flush() drains the queue immediately.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        max_batch_bytes: int = 64 * 1024,
+        max_batch_entries: int = 256,
+        flush_interval: float = 0.1
+    ):
+        self.file_path = file_path
+        self.max_batch_bytes = max_batch_bytes
+        self.max_batch_entries = max_batch_entries
+        self.flush_interval = flush_interval
+        self._file = open(file_path, 'w')
+        self._pending: list[str] = []
+        # Event lines are ASCII-only JSON, so characters == bytes
+        self._pending_bytes = 0
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="BatchedFileSink-flusher", daemon=True
+        )
+        self._flusher.start()
+
+    def write(self, s: str) -> None:
+        with self._lock:
+            if self._closed.is_set():
+                raise ValueError(f"write to closed BatchedFileSink ({self.file_path})")
+            self._pending.append(s)
+            self._pending_bytes += len(s)
+            if (self._pending_bytes >= self.max_batch_bytes
+                    or len(self._pending) >= self.max_batch_entries):
+                self._write_pending()
+
+    def flush(self) -> None:
+        with self._lock:
+            # After close() everything has been written; nothing to do
+            if not self._file.closed:
+                self._write_pending()
+
+    def close(self) -> None:
+        """Stop the flusher and write any queued lines; safe to call twice."""
+        with self._lock:
+            if self._closed.is_set():
+                return
+            self._closed.set()
+        self._flusher.join()
+        with self._lock:
+            self._write_pending()
+            self._file.close()
+
+    def _write_pending(self) -> None:
+        """Write queued lines in one call; caller must hold the lock."""
+        if self._pending:
+            self._file.write("".join(self._pending))
+            self._pending.clear()
+            self._pending_bytes = 0
+        self._file.flush()
+
+    def _flush_loop(self) -> None:
+        while not self._closed.wait(self.flush_interval):
+            with self._lock:
+                if self._pending:
+                    self._write_pending()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
 class StreamSink:
     """Wrapper for file-like objects (sys.stderr, etc)."""
 
@@ -468,6 +791,16 @@ class StreamSink:
             self.stream.flush()
 
 
+# Convert stdlib log levels to our levels
+_STDLIB_LEVELS: Dict[int, Level] = {
+    logging.DEBUG: "debug",
+    logging.INFO: "info",
+    logging.WARNING: "warn",
+    logging.ERROR: "error",
+    logging.CRITICAL: "error"
+}
+
+
 class StdlibLogCapture:
     """
     Captures and normalizes standard library logging into structured events.
@@ -478,16 +811,16 @@ class StdlibLogCapture:
 
     def __init__(self, target_logger: Logger):
         self.target_logger = target_logger
-        self.original_handlers = {}
-        self.captured_loggers = set()
+        # (logger, original handlers, original level, original propagate)
+        self._snapshots: list[tuple[logging.Logger, list[logging.Handler], int, bool]] = []
 
     def capture_logger(self, logger_name: str) -> None:
         """Capture a specific logger and redirect to structured logging."""
         logger = logging.getLogger(logger_name)
 
-        # Store original handlers for restoration
-        if logger_name not in self.original_handlers:
-            self.original_handlers[logger_name] = logger.handlers[:]
+        # Store original state for restoration (only on first capture)
+        if not any(snapshot[0] is logger for snapshot in self._snapshots):
+            self._snapshots.append((logger, logger.handlers[:], logger.level, logger.propagate))
 
         # Clear existing handlers and add our capture handler
         logger.handlers.clear()
@@ -498,8 +831,6 @@ class StdlibLogCapture:
         if logger.level == logging.NOTSET or logger.level > logging.INFO:
             logger.setLevel(logging.INFO)
 
-        self.captured_loggers.add(logger_name)
-
     def capture_all_library_loggers(self) -> None:
         """Capture common noisy library loggers."""
         noisy_loggers = [
@@ -538,18 +869,6 @@ class StdlibLogCapture:
 
             def emit(self, record: logging.LogRecord) -> None:
                 try:
-                    # Convert stdlib log levels to our levels
-                    level_mapping = {
-                        logging.DEBUG: "debug",
-                        logging.INFO: "info",
-                        logging.WARNING: "warn",
-                        logging.ERROR: "error",
-                        logging.CRITICAL: "error"
-                    }
-
-                    level = level_mapping.get(record.levelno, "info")
-                    message = record.getMessage()
-
                     # Extract useful context from log record
                     ctx = {
                         "stdlib_logger": record.name,
@@ -563,7 +882,9 @@ class StdlibLogCapture:
                         ctx["exception"] = self.format(record)
 
                     # Emit through our structured logger
-                    self.target_logger._log(level, message, **ctx)
+                    self.target_logger._log_with_ctx(
+                        _STDLIB_LEVELS.get(record.levelno, "info"), record.getMessage(), ctx
+                    )
 
                 except Exception:
                     # Don't let logging failures break the application
@@ -573,18 +894,13 @@ class StdlibLogCapture:
 
     def restore_all(self) -> None:
         """Restore all captured loggers to their original state."""
-        for logger_name in self.captured_loggers:
-            logger = logging.getLogger(logger_name)
+        for logger, handlers, level, propagate in self._snapshots:
             logger.handlers.clear()
+            logger.handlers.extend(handlers)
+            logger.setLevel(level)
+            logger.propagate = propagate
 
-            # Restore original handlers
-            if logger_name in self.original_handlers:
-                logger.handlers.extend(self.original_handlers[logger_name])
-
-            logger.propagate = True
-
-        self.captured_loggers.clear()
-        self.original_handlers.clear()
+        self._snapshots.clear()
 
 
 def create_bridge_logger(
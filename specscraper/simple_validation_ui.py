@@ -85,7 +85,13 @@ def load_data():
         
         llm_results_df = pd.read_csv(llm_results_path)
         product_specs_df = pd.read_csv(product_specs_path)
-        
+
+        # Raw page HTML lives in a JSONL sidecar next to the results CSV
+        html_sidecar_path = 'workspace/output/llm_results_monitored_html.jsonl'
+        if 'html_content' not in llm_results_df.columns and os.path.exists(html_sidecar_path):
+            html_df = pd.read_json(html_sidecar_path, lines=True)[['id', 'html_content']]
+            llm_results_df = llm_results_df.merge(html_df, on='id', how='left')
+
         # Fill NaN values to avoid JSON serialization issues
         llm_results_df = llm_results_df.fillna('')
         product_specs_df = product_specs_df.fillna('')
@@ -6,12 +6,25 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
 
 from lib.core import HTMLProcessor, PromptTemplator, LLMInvocator, StealthScraper
+from lib.core.scraping import ScrapeResult, ScrapingMethod
 from lib.monitoring import PipelineMonitor
 from lib.monitoring.models import PipelineStage, MetricType, ErrorCategory
 from lib.benchmarking import CacheManager
+import numpy as np
 import pandas as pd
-from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from typing import Any, Optional, Tuple
+import csv
+import json
 import logging
+import math
+import os
 import time
 import argparse
 
@@ -23,47 +36,117 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-# Initialize tools
-stealth_scraper = StealthScraper()
-html_processor = HTMLProcessor()
-prompt_templator = PromptTemplator()
-llm_invocator = LLMInvocator()
-monitor = PipelineMonitor()
-cache_manager = CacheManager()
+# Tools are built by main(), not at import time: HTML worker processes
+# re-import this module under spawn/forkserver and must not construct the
+# scraper, LLM client, monitor or SQLite cache. Workers only get the HTML
+# tools, via _init_html_worker.
+stealth_scraper: Optional[StealthScraper] = None
+html_processor: Optional[HTMLProcessor] = None
+prompt_templator: Optional[PromptTemplator] = None
+llm_invocator: Optional[LLMInvocator] = None
+monitor: Optional[PipelineMonitor] = None
+cache_manager: Optional[CacheManager] = None
+
+
+def _init_tools():
+    """Initialize the pipeline tools in the main process"""
+    global stealth_scraper, llm_invocator, monitor, cache_manager
+    stealth_scraper = StealthScraper()
+    llm_invocator = LLMInvocator()
+    monitor = PipelineMonitor()
+    cache_manager = CacheManager()
+
+
+def _init_html_worker():
+    """Initialize the HTML tools used by _process_html in a worker process"""
+    global html_processor, prompt_templator
+    html_processor = HTMLProcessor()
+    prompt_templator = PromptTemplator()
+
+
+# Pricing per 1K tokens (as of 2024)
+LLM_PRICING = {
+    "gpt-4o-mini": {"input": 0.00015, "output": 0.0006},  # per 1K tokens
+    "gpt-4o": {"input": 0.005, "output": 0.015},
+    "gpt-3.5-turbo": {"input": 0.0005, "output": 0.0015}
+}
+
+# Per-token (input, output) rates, precomputed from LLM_PRICING
+_COST_PER_TOKEN = {
+    model: (prices["input"] / 1000, prices["output"] / 1000)
+    for model, prices in LLM_PRICING.items()
+}
 
 
 def estimate_llm_cost(model: str, prompt_len: int, response_len: int = 1000) -> float:
     """Estimate cost based on model and token counts"""
-    # Rough estimation: 1 token ≈ 4 characters
-    prompt_tokens = prompt_len // 4
-    response_tokens = response_len // 4
-    total_tokens = prompt_tokens + response_tokens
-    
-    # Pricing per 1K tokens (as of 2024)
-    pricing = {
-        "gpt-4o-mini": {"input": 0.00015, "output": 0.0006},  # per 1K tokens
-        "gpt-4o": {"input": 0.005, "output": 0.015},
-        "gpt-3.5-turbo": {"input": 0.0005, "output": 0.0015}
-    }
-    
-    if model not in pricing:
+    rates = _COST_PER_TOKEN.get(model)
+    if rates is None:
         return 0.0
-        
-    input_cost = (prompt_tokens / 1000) * pricing[model]["input"]
-    output_cost = (response_tokens / 1000) * pricing[model]["output"]
     
-    return input_cost + output_cost
+    # Rough estimation: 1 token ≈ 4 characters
+    return (prompt_len // 4) * rates[0] + (response_len // 4) * rates[1]
+
+
+# Template for rows without a usable LLM response, copied per row. Error
+# details for failed fetches and LLM calls go in its specification field.
+_EMPTY_OUTPUT = PromptTemplator.ProductExtractionOutput.empty()
+
+# Per-row page bodies, joined to llm_results_monitored.csv on id
+HTML_SIDECAR_FILE = "llm_results_monitored_html.jsonl"
+
+# Columns appended to each results CSV row after the input and scrape columns
+_PROMPT_COLUMNS = ['cleaned_html', 'cleaned_html_len', 'prompt', 'prompt_len', 'llm_response']
+
+
+def _csv_value(value: Any) -> Any:
+    """Render a cell like DataFrame.to_csv does for missing values"""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ''
+    return value
+
+
+def _process_html(task: Tuple[Any, str, str]) -> Tuple[Any, str, Optional[str], Optional[str], float, Optional[str]]:
+    """
+    Clean one page and build its extraction prompt (runs in a worker process)
+
+    Returns (id, url, cleaned_html_json, prompt, processing_time, error);
+    on failure the HTML and prompt are None and error holds the message.
+    """
+    index, product_url, html_content = task
+    start_time = time.time()
+    try:
+        cleaned_html_json = html_processor.clean_html(html_content).model_dump_json()
+        prompt = prompt_templator.product_extraction(product_url, cleaned_html_json)
+    except Exception as e:
+        return index, product_url, None, None, time.time() - start_time, str(e)
+    return index, product_url, cleaned_html_json, prompt, time.time() - start_time, None
+
+
+def _invoke_llm(model_name: str, prompt: str) -> Tuple[Optional[str], Optional[str]]:
+    """Invoke the LLM for one prompt, returning (response, error message)"""
+    try:
+        return llm_invocator.invoke_llm(
+            model_provider="openai",
+            llm_model_name=model_name,
+            prompt=prompt
+        ), None
+    except Exception as e:
+        return None, str(e)
 
 
 def main(input_file: str = "workspace/input/specbook.csv", 
          output_dir: str = "workspace/output",
          model_name: str = "gpt-4o-mini",
-         use_cache: bool = True):
+         use_cache: bool = True,
+         scrape_workers: int = 10):
     """Main pipeline execution with monitoring"""
+    _init_tools()
     
     # Load input data
     logger.info(f"Loading URLs from {input_file}")
-    df = pd.read_csv(input_file)
+    # pyarrow's multithreaded CSV reader is much faster on large inputs
+    df = pd.read_csv(input_file, engine='pyarrow') if PYARROW_AVAILABLE else pd.read_csv(input_file)
     df['id'] = range(1, len(df) + 1)
     
     # Start monitoring
@@ -72,23 +155,90 @@ def main(input_file: str = "workspace/input/specbook.csv",
     
     try:
         # STEP 1: Scrape product sites with caching
+        # STEP 2 (cleaning HTML and generating prompts) is pipelined with it:
+        # each page is handed to the HTML worker processes as soon as it
+        # arrives, and scrapes are handled in completion order
         logger.info(f"Starting web scraping phase... (cache {'enabled' if use_cache else 'disabled'})")
-        product_scrape_results = []
+        # One slot per input row, so results line up with df positionally
+        product_scrape_results = [None] * len(df)
+        html_futures = []
         
-        def scrape_with_cache(url: str):
-            """Scrape URL with cache fallback"""
-            # Check cache first
-            if use_cache:
-                cached_html = cache_manager.get_cached_html(url)
-                if cached_html:
-                    logger.info(f"Cache hit for {url}")
+        def scrape_and_cache(url: str):
+            """Scrape a URL that was not in the cache, storing successful results"""
+            logger.debug("%s %s", "Cache miss, scraping" if use_cache else "Scraping", url)
+            scrape_result = stealth_scraper.scrape_url(url)
+            
+            # Store successful results in cache
+            if scrape_result.success and scrape_result.content and use_cache:
+                cache_manager.store_html(url, scrape_result.content, {
+                    'scrape_method': scrape_result.final_method.value,
+                    'status_code': scrape_result.status_code,
+                    'scrape_time': scrape_result.scrape_time
+                })
+                logger.debug("Cached result for %s", url)
+            
+            return scrape_result
+        
+        def record_scrape(position: int, id, url: str, product_search_result, html_executor):
+            """Record a finished scrape, write its HTML sidecar row and queue the HTML for processing"""
+            # Record scraping metrics
+            monitor.record_scrape_result(product_search_result, stage=PipelineStage.SCRAPING)
+            
+            product_scrape_results[position] = {
+                'success': product_search_result.success,
+                'content_length': len(product_search_result.content) if product_search_result.content else 0,
+                'status_code': product_search_result.status_code,
+                'final_method': product_search_result.final_method,
+                'error_reason': product_search_result.error_reason,
+                'page_issues': product_search_result.page_issues,
+            }
+            sidecar_file.write(json.dumps({
+                'id': id,
+                'html_content': product_search_result.content,
+                # The page body is already in html_content; serializing it
+                # again would double the largest per-row cost of this step
+                'full_result': product_search_result.model_dump_json(exclude={'content'})
+            }, default=str) + "\n")
+            
+            if product_search_result.success == True:
+                html_futures.append(html_executor.submit(
+                    _process_html, (id, url, str(product_search_result.content))
+                ))
+        
+        # Look up every URL in the cache with one bulk query, then only send
+        # the misses through the scraping thread pool
+        input_rows = list(df[['id', 'product_url']].itertuples(index=False))
+        positions = {row.id: position for position, row in enumerate(input_rows)}
+        urls = [row.product_url for row in input_rows]
+        cached_html = cache_manager.get_batch_cached_html(urls) if use_cache else {}
+        if use_cache:
+            cache_hits = sum(1 for url in urls if cached_html.get(url))
+            logger.info(f"Cache: {cache_hits} hits / {len(urls) - cache_hits} misses")
+        
+        # (cleaned_html_json, prompt) per row position; each entry is released
+        # as soon as its results row has been written
+        prompt_data = {}
+        
+        # Page bodies (html_content, full_result) go to a JSONL sidecar keyed
+        # by id as each scrape is recorded, keeping them out of the results CSV
+        with open(f"{output_dir}/{HTML_SIDECAR_FILE}", 'w', encoding='utf-8') as sidecar_file, \
+                ThreadPoolExecutor(max_workers=scrape_workers) as scrape_executor, \
+                ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_html_worker) as html_executor:
+            scrape_futures = {
+                scrape_executor.submit(scrape_and_cache, row.product_url): (position, row.id, row.product_url)
+                for position, row in enumerate(input_rows)
+                if not cached_html.get(row.product_url)
+            }
+            
+            for position, (id, url) in enumerate(input_rows):
+                if cached_html.get(url):
+                    logger.debug("Cache hit for %s", url)
                     # Create a mock ScrapeResult for cached content
-                    from lib.core.scraping import ScrapeResult, ScrapingMethod
-                    return ScrapeResult(
+                    record_scrape(position, id, url, ScrapeResult(
                         url=url,
                         final_url=url,
                         success=True,
-                        content=cached_html,
+                        content=cached_html[url],
                         status_code=200,
                         final_method=ScrapingMethod.CACHED,
                         methods_tried={ScrapingMethod.CACHED},
@@ -97,73 +247,34 @@ def main(input_file: str = "workspace/input/specbook.csv",
                         scrape_time=0.0,
                         attempts=1,
                         warnings=[]
-                    )
+                    ), html_executor)
+            # Every cached page is queued for processing; drop the bodies here
+            cached_html.clear()
             
-            # Cache miss - perform actual scraping
-            logger.info(f"{'Cache miss for ' + url + ', scraping...' if use_cache else 'Scraping ' + url + '...'}")
-            scrape_result = stealth_scraper.scrape_url(url)
+            for future in as_completed(scrape_futures):
+                position, id, url = scrape_futures[future]
+                record_scrape(position, id, url, future.result(), html_executor)
             
-            # Store successful results in cache
-            if scrape_result.success and scrape_result.content and use_cache:
-                cache_manager.store_html(url, scrape_result.content, {
-                    'scrape_method': scrape_result.final_method.value,
-                    'status_code': scrape_result.status_code,
-                    'scrape_time': scrape_result.scrape_time
-                })
-                logger.info(f"Cached result for {url}")
+            # Print scraping summary
+            print("\n=== Scraping Summary ===")
+            print(pd.DataFrame(product_scrape_results).value_counts(['success', 'status_code', 'final_method']))
+            print("========================\n")
             
-            return scrape_result
-        
-        # Use cache-aware scraping
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            for id, product_search_result in zip(df['id'], executor.map(scrape_with_cache, df['product_url'].to_list())):
-                # Record scraping metrics
-                monitor.record_scrape_result(product_search_result, stage=PipelineStage.SCRAPING)
-                
-                product_scrape_results.append({
-                    'id': id,
-                    'product_url': product_search_result.url,
-                    'success': product_search_result.success,
-                    'content_length': len(product_search_result.content) if product_search_result.content else 0,
-                    'status_code': product_search_result.status_code,
-                    'final_method': product_search_result.final_method,
-                    'error_reason': product_search_result.error_reason,
-                    'page_issues': product_search_result.page_issues,
-                    'html_content': product_search_result.content,
-                    'full_result': product_search_result.model_dump_json()
-                })
-
-        product_scrape_results_df = pd.DataFrame(product_scrape_results)
-        
-        # Print scraping summary
-        print("\n=== Scraping Summary ===")
-        print(product_scrape_results_df.value_counts(['success', 'status_code', 'final_method']))
-        print("========================\n")
-        
-        product_scrape_results_df = df.merge(product_scrape_results_df, on='id', how='left') \
-            .drop(columns=['product_url_y']) \
-            .rename(columns={'product_url_x': 'product_url'})
-
-        # STEP 2: Clean HTML and generate prompts
-        logger.info("Processing HTML and generating prompts...")
-        product_scrape_results_df_success = product_scrape_results_df[product_scrape_results_df['success'] == True]
-        product_prompts_df = product_scrape_results_df.copy()
-
-        for id, product_url, html_content in zip(
-            product_scrape_results_df_success['id'], 
-            product_scrape_results_df_success['product_url'], 
-            product_scrape_results_df_success['html_content']
-        ):
-            try:
-                # Record HTML processing start
-                start_time = time.time()
-                
-                cleaned_html = html_processor.clean_html(str(html_content))
-                cleaned_html_json = cleaned_html.model_dump_json()
-                prompt = prompt_templator.product_extraction(product_url, cleaned_html_json)
+            # Collect HTML results; metrics and errors are recorded here in
+            # the parent since the monitor lives in this process
+            logger.info("Processing HTML and generating prompts...")
+            for future in as_completed(html_futures):
+                id, product_url, cleaned_html_json, prompt, processing_time, error = future.result()
+                if error is not None:
+                    logger.error(f"Error processing HTML for URL {product_url}: {error}")
+                    monitor.record_error(
+                        category=ErrorCategory.VALIDATION_ERROR,
+                        stage=PipelineStage.HTML_PROCESSING,
+                        url=product_url,
+                        error_message=error
+                    )
+                    continue
                 
-                # Record processing time
-                processing_time = time.time() - start_time
                 monitor.record_metric(
                     name="html_processing.duration_seconds",
                     value=processing_time,
@@ -171,49 +282,30 @@ def main(input_file: str = "workspace/input/specbook.csv",
                     stage=PipelineStage.HTML_PROCESSING
                 )
                 
-                # Add fields dynamically using loc
-                product_prompts_df.loc[product_prompts_df['id'] == id, 'cleaned_html'] = cleaned_html_json
-                product_prompts_df.loc[product_prompts_df['id'] == id, 'cleaned_html_len'] = len(cleaned_html_json)
-                product_prompts_df.loc[product_prompts_df['id'] == id, 'prompt'] = prompt
-                product_prompts_df.loc[product_prompts_df['id'] == id, 'prompt_len'] = len(prompt)
-                
-            except Exception as e:
-                logger.error(f"Error processing HTML for URL {product_url}: {e}")
-                monitor.record_error(
-                    category=ErrorCategory.VALIDATION_ERROR,
-                    stage=PipelineStage.HTML_PROCESSING,
-                    url=product_url,
-                    error_message=str(e)
-                )
-
+                prompt_data[positions[id]] = (cleaned_html_json, prompt)
+        
         # STEP 3: Invoke LLM
         logger.info(f"Starting LLM extraction with model {model_name}...")
-        llm_results_df = product_prompts_df.copy()
-        total_prompt_tokens = llm_results_df['prompt_len'].sum() // 4  # Rough estimate
-
-        for id, success, prompt in zip(llm_results_df['id'], llm_results_df['success'], llm_results_df['prompt']):
-            default_response = PromptTemplator.ProductExtractionOutput(
-                    image_url="",
-                    type="",
-                    description="",
-                    model_no="",
-                    product_link="",
-                )
-
-            if success == True and pd.notna(prompt):
-                try:
-                    start_time = time.time()
-                    
-                    llm_response = llm_invocator.invoke_llm(
-                        model_provider="openai",
-                        llm_model_name=model_name,
-                        prompt=prompt
-                    )
-                    
+        input_values = list(df.itertuples(index=False, name=None))
+        scrape_columns = list(product_scrape_results[0]) if product_scrape_results else []
+        
+        # Validated outputs, kept so STEP 4 does not re-parse the JSON
+        parsed_outputs = [None] * len(df)
+        total_prompt_len = 0
+        
+        def write_row(position: int, invocation: Optional[Tuple[Optional[str], Optional[str]]]):
+            """Record one row's LLM outcome and write it to the results CSV"""
+            nonlocal total_prompt_len
+            scrape = product_scrape_results[position]
+            cleaned_html_json, prompt = prompt_data.pop(position, (None, None))
+            default_response = _EMPTY_OUTPUT.model_copy()
+            
+            if invocation is not None:
+                llm_response, error = invocation
+                
+                if error is None:
                     # Calculate cost and record metrics
-                    llm_time = time.time() - start_time
-                    prompt_len = len(prompt) if prompt else 0
-                    estimated_cost = estimate_llm_cost(model_name, prompt_len)
+                    estimated_cost = estimate_llm_cost(model_name, len(prompt))
                     
                     # Get actual token usage if available
                     usage_stats = llm_invocator.get_usage_stats(model_name)
@@ -227,58 +319,96 @@ def main(input_file: str = "workspace/input/specbook.csv",
                     )
                     
                     # Validate response
-                    default_response = PromptTemplator.ProductExtractionOutput.model_validate_json(llm_response)
-                    
-                except Exception as e:
-                    error_msg = f"Error invoking LLM: {e}"
+                    try:
+                        default_response = PromptTemplator.ProductExtractionOutput.model_validate_json(llm_response)
+                    except Exception as e:
+                        error = str(e)
+                
+                if error is not None:
+                    error_msg = f"Error invoking LLM: {error}"
                     logger.error(error_msg)
-                    default_response.description = error_msg
+                    default_response.specification = error_msg
                     
                     monitor.record_llm_result(
                         success=False,
                         model=model_name,
-                        error=str(e)
+                        error=error
                     )
             else:
-                # For failed scrapes, populate description with error details
-                row_data = llm_results_df[llm_results_df['id'] == id].iloc[0]
-                status_code = row_data.get('status_code', 'Unknown')
-                error_reason = row_data.get('error_reason', 'Unknown error')
-                default_response.description = f"FETCH_FAILED: Status {status_code} - {error_reason}"
-
-            llm_results_df.loc[llm_results_df['id'] == id, 'llm_response'] = default_response.model_dump_json()
-
+                # For failed scrapes, populate specification with error details
+                status_code = scrape['status_code'] if scrape['status_code'] is not None else 'Unknown'
+                error_reason = scrape['error_reason'] or 'Unknown error'
+                default_response.specification = f"FETCH_FAILED: Status {status_code} - {error_reason}"
+            
+            parsed_outputs[position] = default_response
+            if prompt is not None:
+                total_prompt_len += len(prompt)
+            csv_writer.writerow(
+                [_csv_value(value) for value in input_values[position]]
+                + [_csv_value(scrape[column]) for column in scrape_columns]
+                + [
+                    _csv_value(cleaned_html_json),
+                    len(cleaned_html_json) if cleaned_html_json is not None else '',
+                    _csv_value(prompt),
+                    len(prompt) if prompt is not None else '',
+                    default_response.model_dump_json()
+                ]
+            )
+        
+        # LLM calls are network-bound: issue them concurrently, sized to the
+        # model's request budget (the invocator's rate limiter still gates
+        # every call). Each row is written to the results CSV as soon as it
+        # and every row before it are done, so the file stays in input order
+        pending = {
+            position for position, scrape in enumerate(product_scrape_results)
+            if scrape['success'] == True and position in prompt_data
+        }
+        invocations = {}
+        next_position = 0
+        
+        def write_ready_rows():
+            """Write rows in input order up to the first one still awaiting its LLM call"""
+            nonlocal next_position
+            while next_position < len(df) and (next_position not in pending or next_position in invocations):
+                write_row(next_position, invocations.pop(next_position, None))
+                next_position += 1
+        
+        rate_limits = llm_invocator.rate_limiter.RATE_LIMITS
+        rpm = rate_limits.get(model_name, rate_limits["default"]).requests_per_minute
+        with open(f"{output_dir}/llm_results_monitored.csv", 'w', newline='', encoding='utf-8') as csv_file, \
+                ThreadPoolExecutor(max_workers=max(1, min(16, rpm // 60))) as executor:
+            csv_writer = csv.writer(csv_file)
+            csv_writer.writerow(list(df.columns) + scrape_columns + _PROMPT_COLUMNS)
+            
+            llm_futures = {
+                executor.submit(_invoke_llm, model_name, prompt_data[position][1]): position
+                for position in sorted(pending)
+            }
+            write_ready_rows()
+            for future in as_completed(llm_futures):
+                invocations[llm_futures.pop(future)] = future.result()
+                write_ready_rows()
+        
         # STEP 4: Save results
         logger.info("Saving results...")
-        print(f"\nProcessed {llm_results_df.count()['id']} URLs")
-        llm_results_df.to_csv(f"{output_dir}/llm_results_monitored.csv", index=False)
-
-        total_prompt_len = llm_results_df['prompt_len'].sum()
+        print(f"\nProcessed {len(df)} URLs")
+        
         print(f"Total prompt length: {total_prompt_len:,}")
-
-        # Extract product specs - filter based on scraping success
-        successful_results = []
-        failed_results = []
-
-        for i, (response, success) in enumerate(zip(llm_results_df['llm_response'], llm_results_df['success'])):
-            result_dict = dict(PromptTemplator.ProductExtractionOutput.model_validate_json(response))
-            
-            if success:
-                # Include all fields for successful extractions
-                successful_results.append(result_dict)
-            else:
-                # Only include description field for failed fetches (contains error info)
-                failed_results.append({
-                    'image_url': '',
-                    'type': '',
-                    'description': result_dict['description'],  # Contains error info
-                    'model_no': '',
-                    'product_link': ''
-                })
-
-        # Combine results and save
-        all_results = successful_results + failed_results
-        product_specs_df = pd.DataFrame(all_results)
+        
+        # Extract product specs - filter based on scraping success. Failed
+        # fetches only keep the specification field (contains error info)
+        output_fields = list(PromptTemplator.ProductExtractionOutput.model_fields)
+        fail_mask = np.array([scrape['success'] != True for scrape in product_scrape_results], dtype=bool)
+        product_specs_df = pd.DataFrame({
+            field: [
+                '' if failed and field != 'specification' else getattr(output, field, '')
+                for output, failed in zip(parsed_outputs, fail_mask)
+            ]
+            for field in output_fields
+        })
+        
+        # Successful extractions first, then failed fetches
+        product_specs_df = pd.concat([product_specs_df[~fail_mask], product_specs_df[fail_mask]])
         product_specs_df.to_csv(f"{output_dir}/product_specs_monitored.csv", index=False)
 
         # End monitoring and print summary
@@ -322,6 +452,9 @@ if __name__ == "__main__":
                        help="Use cached HTML content when available (default: enabled)")
     parser.add_argument("--no-cache", dest="use_cache", action="store_false",
                        help="Disable cache usage and always scrape fresh")
+    parser.add_argument("--scrape-workers", type=int, default=10,
+                       help="Number of concurrent scrape requests (default: 10)")
     
     args = parser.parse_args()
-    main(input_file=args.input, output_dir=args.output_dir, model_name=args.model, use_cache=args.use_cache)
\ No newline at end of file
+    main(input_file=args.input, output_dir=args.output_dir, model_name=args.model, use_cache=args.use_cache,
+         scrape_workers=args.scrape_workers)
\ No newline at end of file
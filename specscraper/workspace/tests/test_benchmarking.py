@@ -5,6 +5,7 @@ import json
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch
+from pydantic import ValidationError
 import sys
 
 # Add project root to path
@@ -13,7 +14,7 @@ sys.path.append(str(Path(__file__).resolve().parent.parent.parent.parent.parent)
 from lib.benchmarking import CacheManager, ReportGenerator
 from lib.benchmarking.models import (
     ExperimentConfig, ExperimentResult, ExperimentSummary,
-    QualityMetrics, ModelProvider
+    QualityMetrics, ModelProvider, dump_result
 )
 
 
@@ -101,7 +102,21 @@ class TestCacheManager:
         assert results[urls[0]] == "<html>Content 1</html>"
         assert results[urls[1]] is None  # Not cached
         assert results[urls[2]] == "<html>Content 3</html>"
-    
+
+    def test_batch_cached_html_chunks_queries(self):
+        """Test batch lookups larger than one IN (...) query"""
+        self.cache_manager.SQLITE_BATCH_SIZE = 2
+        urls = [f"https://example.com/{i}" for i in range(5)]
+        for url in urls[:4]:
+            self.cache_manager.store_html(url, f"<html>{url}</html>")
+        self.cache_manager.clear_memory_cache()
+
+        results = self.cache_manager.get_batch_cached_html(urls)
+
+        assert [results[url] for url in urls] == [f"<html>{url}</html>" for url in urls[:4]] + [None]
+        stats = self.cache_manager.get_cache_stats()
+        assert all(entry["count"] == 1 for entry in stats["most_accessed"])
+
     def test_metadata_storage(self):
         """Test storing metadata with HTML"""
         url = "https://example.com/product"
@@ -136,6 +151,11 @@ class TestExperimentModels:
         assert config.temperature == 0.7  # Default value
         assert config.max_tokens == 1000  # Default value
         assert config.model_provider == ModelProvider.OPENAI  # Default
+        
+        # Frozen configs are hashable and usable as dict keys
+        assert {config: 1}[config] == 1
+        with pytest.raises(ValidationError):
+            config.temperature = 0.1
     
     def test_quality_metrics(self):
         """Test quality metrics model"""
@@ -184,6 +204,8 @@ class TestExperimentModels:
         
         assert result.url == "https://example.com"
         assert result.execution_time == 2.5
+        assert ExperimentResult.from_dict(result.to_dict(mode="json")) == result
+        assert json.loads(dump_result(result)) == result.to_dict(mode="json")
         assert result.total_tokens == 700
         assert result.extraction_successful
     
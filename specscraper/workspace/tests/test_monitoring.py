@@ -1,6 +1,6 @@
 """Tests for monitoring functionality"""
+import json
 import pytest
-import tempfile
 from datetime import datetime
 from pathlib import Path
 import sys
@@ -9,20 +9,40 @@ import sys
 sys.path.append(str(Path(__file__).resolve().parent.parent.parent.parent.parent))
 
 from lib.monitoring import PipelineMonitor, MetricsCollector, ErrorAnalyzer
+from lib.monitoring import error_analyzer
 from lib.monitoring.models import (
     PipelineMetric, PipelineError, PipelineExecution,
-    MetricType, ErrorCategory, PipelineStage
+    MetricType, ErrorCategory, PipelineStage, CounterIdx
 )
 from lib.core.scraping import ScrapeResult, ScrapingMethod, PageIssue
 
 
+class _FakeAhoCorasick:
+    """Minimal stand-in for the pyahocorasick module (substring scan, same API)"""
+    
+    class Automaton(dict):
+        def add_word(self, word, value):
+            self[word] = value
+        
+        def make_automaton(self):
+            pass
+        
+        def iter(self, text):
+            for word, value in self.items():
+                start = text.find(word)
+                while start != -1:
+                    yield start + len(word) - 1, value
+                    start = text.find(word, start + 1)
+
+
 class TestPipelineMonitor:
     """Test the PipelineMonitor class"""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
         """Setup for each test"""
-        # Use temporary directory for tests
-        self.temp_dir = tempfile.mkdtemp()
+        # Use pytest's per-test directory; it is cleaned up automatically
+        self.temp_dir = str(tmp_path)
         self.monitor = PipelineMonitor(metrics_dir=self.temp_dir)
     
     def test_start_execution(self):
@@ -35,21 +55,11 @@ class TestPipelineMonitor:
         assert self.monitor.current_execution.total_urls == 10
         assert self.monitor.current_execution.successful_scrapes == 0
     
-    def test_record_successful_scrape(self):
+    def test_record_successful_scrape(self, mock_scrape_result):
         """Test recording a successful scrape result"""
         self.monitor.start_execution(total_urls=1)
         
-        # Create mock successful scrape result
-        result = ScrapeResult(
-            success=True,
-            url="https://example.com",
-            status_code=200,
-            content="<html>Test content</html>",
-            final_url="https://example.com",
-            final_method=ScrapingMethod.REQUESTS
-        )
-        
-        self.monitor.record_scrape_result(result)
+        self.monitor.record_scrape_result(mock_scrape_result)
         
         assert self.monitor.current_execution.successful_scrapes == 1
         assert self.monitor.current_execution.failed_scrapes == 0
@@ -75,25 +85,60 @@ class TestPipelineMonitor:
         assert self.monitor.current_execution.successful_scrapes == 0
         assert self.monitor.current_execution.failed_scrapes == 1
     
-    def test_record_bot_detection(self):
+    def test_record_bot_detection(self, bot_scrape_result):
         """Test recording bot detection"""
         self.monitor.start_execution(total_urls=1)
         
-        result = ScrapeResult(
-            success=False,
-            url="https://example.com",
-            status_code=403,
-            content=None,
-            final_url="https://example.com",
-            final_method=ScrapingMethod.REQUESTS,
-            error_reason="Bot detected",
-            page_issues=[PageIssue.BOT_DETECTED]
-        )
-        
-        self.monitor.record_scrape_result(result)
+        self.monitor.record_scrape_result(bot_scrape_result)
         
         assert self.monitor.current_execution.bot_detections == 1
-    
+
+    def test_record_scrape_results_batch(self):
+        """Test recording a batch of scrape results"""
+        self.monitor.start_execution(total_urls=3)
+
+        results = [
+            ScrapeResult(
+                success=True,
+                url="https://example.com/1",
+                status_code=200,
+                content="<html>Test content</html>",
+                final_url="https://example.com/1",
+                final_method=ScrapingMethod.REQUESTS,
+                scrape_time=0.5
+            ),
+            ScrapeResult(
+                success=False,
+                url="https://example.com/2",
+                status_code=403,
+                content=None,
+                final_url="https://example.com/2",
+                final_method=ScrapingMethod.REQUESTS,
+                error_reason="Bot detected",
+                page_issues=[PageIssue.BOT_DETECTED]
+            ),
+            ScrapeResult(
+                success=False,
+                url="https://example.com/3",
+                status_code=None,
+                content=None,
+                final_url="https://example.com/3",
+                final_method=ScrapingMethod.REQUESTS,
+                error_reason="Timeout",
+                page_issues=[PageIssue.TIMEOUT]
+            ),
+        ]
+
+        self.monitor.record_scrape_results(results)
+
+        execution = self.monitor.current_execution
+        assert execution.successful_scrapes == 1
+        assert execution.failed_scrapes == 2
+        assert execution.bot_detections == 1
+        assert execution.network_errors == 1
+        assert [e.url for e in execution.errors] == ["https://example.com/2", "https://example.com/3"]
+        assert [m.name for m in execution.metrics].count("scrape.method") == 3
+
     def test_record_llm_success(self):
         """Test recording successful LLM result"""
         self.monitor.start_execution(total_urls=1)
@@ -158,14 +203,29 @@ class TestPipelineMonitor:
         assert "total_urls" in stats
         assert "progress" in stats
         assert stats["total_urls"] == 10
+        
+        # Unchanged counters reuse the cached snapshot, which is read-only
+        assert self.monitor.get_current_stats() is stats
+        with pytest.raises(TypeError):
+            stats["total_urls"] = 0
+        with pytest.raises(TypeError):
+            stats["progress"]["successful"] = 99
+        
+        # Every record_* call invalidates the cache
+        self.monitor.record_llm_result(success=True, model="gpt-4o-mini", cost=0.5)
+        assert self.monitor.get_current_stats()["cost"]["total"] == 0.5
+        self.monitor.current_execution.bot_detections = 3
+        self.monitor.invalidate_stats_cache()
+        assert self.monitor.get_current_stats()["errors"]["bot_detections"] == 3
 
 
 class TestMetricsCollector:
     """Test the MetricsCollector class"""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
         """Setup for each test"""
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = str(tmp_path)
         self.collector = MetricsCollector(metrics_dir=self.temp_dir)
     
     def create_mock_execution(self, execution_id: str = "test_exec") -> PipelineExecution:
@@ -213,6 +273,16 @@ class TestMetricsCollector:
         assert stats["overall_success_rate"] == 0.8  # 16/20
         assert stats["cost"]["total"] == 0.1  # 0.05 per execution
     
+    def test_counter_vector(self):
+        """Test that counter fields map onto their CounterIdx positions"""
+        vector = self.create_mock_execution().counter_vector()
+        
+        assert vector.shape == (len(CounterIdx),)
+        assert vector[CounterIdx.SUCCESSFUL_SCRAPES] == 8
+        assert vector[CounterIdx.FAILED_SCRAPES] == 2
+        assert vector[CounterIdx.SUCCESSFUL_LLM_CALLS] == 8
+        assert vector[CounterIdx.BOT_DETECTIONS] == 0
+    
     def test_aggregate_metrics(self):
         """Test metric aggregation"""
         executions = [self.create_mock_execution()]
@@ -230,6 +300,41 @@ class TestMetricsCollector:
         assert histogram_metric["type"] == "histogram"
         assert histogram_metric["mean"] == 2.5
     
+    def test_update_rollup(self):
+        """Test incremental rollup matches a full aggregation"""
+        executions = [
+            self.create_mock_execution("exec1"),
+            self.create_mock_execution("exec2")
+        ]
+
+        self.collector.update_rollup(executions[:1])
+        rollup = self.collector.update_rollup(executions)
+        # Folding the same executions again must not double count
+        rollup = self.collector.update_rollup(executions)
+        aggregated = self.collector.aggregate_metrics(executions)
+
+        assert rollup["scrape.success"]["total"] == aggregated["scrape.success"]["total"] == 16
+        assert rollup["scrape.success"]["by_execution"] == {"exec1": 8, "exec2": 8}
+        histogram = rollup["scrape.duration_seconds"]
+        assert histogram["count"] == 2
+        assert histogram["mean"] == 2.5
+        assert histogram["p50"] == pytest.approx(2.5, rel=0.01)
+        assert not (Path(self.temp_dir) / "rollup.json.tmp").exists()
+
+    def test_history_report_uses_rollup(self):
+        """Test that completed executions are folded into the rollup for history reports"""
+        monitor = PipelineMonitor(metrics_dir=self.temp_dir)
+        monitor.start_execution(total_urls=3)
+        execution = monitor.end_execution()
+
+        rollup = json.loads((Path(self.temp_dir) / "rollup.json").read_text())
+        assert rollup["executions"] == [execution.execution_id]
+        assert rollup["metrics"]["pipeline.completed"]["sum"] == 1
+
+        report = self.collector.generate_history_report()
+        assert "- pipeline.completed: 1.0 total" in report
+        assert json.loads((Path(self.temp_dir) / "rollup.json").read_text()) == rollup
+
     def test_generate_metrics_report(self):
         """Test generating a metrics report"""
         executions = [self.create_mock_execution()]
@@ -241,6 +346,121 @@ class TestMetricsCollector:
         assert "Error Breakdown" in report
         assert "Cost Analysis" in report
 
+    def test_load_all_executions(self):
+        """Test loading execution records from the rolling log"""
+        for hour, execution_id in [(12, "exec_2"), (9, "exec_1")]:
+            execution = self.create_mock_execution(execution_id)
+            execution.start_time = datetime(2025, 1, 1, hour)
+            self.collector.append_execution(execution)
+        with open(Path(self.temp_dir) / "executions.jsonl", "a") as f:
+            f.write("{not json\n")
+
+        executions = self.collector.load_all_executions()
+
+        assert [e.execution_id for e in executions] == ["exec_1", "exec_2"]
+        assert executions[0].metrics[0].name == "scrape.success"
+
+    def test_executions_saved_only_to_log(self):
+        """Test that completed executions are written once, to the log"""
+        monitor = PipelineMonitor(metrics_dir=self.temp_dir)
+        monitor.start_execution(total_urls=3)
+        execution = monitor.end_execution()
+
+        executions = self.collector.load_all_executions()
+
+        assert (Path(self.temp_dir) / "executions.jsonl").exists()
+        assert list(Path(self.temp_dir).glob("exec_*.json")) == []
+        assert [e.execution_id for e in executions] == [execution.execution_id]
+        assert executions[0].total_urls == 3
+        assert monitor.load_execution(execution.execution_id).total_urls == 3
+        assert monitor.load_execution("exec_missing") is None
+
+    def test_import_execution_files(self):
+        """Test folding legacy per-execution files into the log"""
+        self.collector.append_execution(self.create_mock_execution("exec_1"))
+        for execution_id in ["exec_1", "exec_2"]:
+            execution = self.create_mock_execution(execution_id)
+            (Path(self.temp_dir) / f"{execution_id}.json").write_text(execution.model_dump_json())
+        (Path(self.temp_dir) / "exec_broken.json").write_text("{not json")
+
+        assert self.collector.import_execution_files() == 1
+        assert self.collector.import_execution_files() == 0
+        executions = self.collector.load_all_executions()
+        assert sorted(e.execution_id for e in executions) == ["exec_1", "exec_2"]
+
+    def test_load_all_executions_legacy_files(self):
+        """Test that legacy exec_*.json files load and are migrated on first load"""
+        self.collector.append_execution(self.create_mock_execution("exec_1"))
+        legacy = self.create_mock_execution("exec_2")
+        (Path(self.temp_dir) / "exec_2.json").write_text(legacy.model_dump_json())
+
+        first = self.collector.load_all_executions()
+        second = self.collector.load_all_executions()
+
+        assert sorted(e.execution_id for e in first) == ["exec_1", "exec_2"]
+        assert sorted(e.execution_id for e in second) == ["exec_1", "exec_2"]
+        log_lines = (Path(self.temp_dir) / "executions.jsonl").read_text().splitlines()
+        assert len(log_lines) == 2
+
+    def test_load_execution(self):
+        """Test loading one execution from the log or a legacy file"""
+        for execution_id in ["exec_1", "exec_10"]:
+            self.collector.append_execution(self.create_mock_execution(execution_id))
+        legacy = self.create_mock_execution("exec_legacy")
+        (Path(self.temp_dir) / "exec_legacy.json").write_text(legacy.model_dump_json())
+
+        assert self.collector.load_execution("exec_1").execution_id == "exec_1"
+        assert self.collector.load_execution("exec_10").execution_id == "exec_10"
+        assert self.collector.load_execution("exec_legacy").execution_id == "exec_legacy"
+        assert self.collector.load_execution("exec_missing") is None
+
+    def test_load_all_executions_interns_labels(self):
+        """Test that identical metric labels share one dict after loading"""
+        execution = self.create_mock_execution("exec_1")
+        for metric in execution.metrics:
+            metric.labels = {"method": "requests"}
+        self.collector.append_execution(execution)
+
+        loaded = self.collector.load_all_executions()[0]
+
+        assert loaded.metrics[0].labels == {"method": "requests"}
+        assert loaded.metrics[0].labels is loaded.metrics[1].labels
+
+    def test_interned_labels_are_read_only(self):
+        """Test that shared labels cannot be mutated through one metric"""
+        execution = self.create_mock_execution("exec_1")
+        for metric in execution.metrics:
+            metric.labels = {"method": "requests"}
+        self.collector.append_execution(execution)
+
+        first = self.collector.load_all_executions()[0]
+        with pytest.raises(TypeError):
+            first.metrics[0].labels["method"] = "firecrawl"
+        first.metrics[0].labels = {**first.metrics[0].labels, "method": "firecrawl"}
+        assert first.metrics[1].labels == {"method": "requests"}
+
+        # Separate loads do not share label objects, and copies stay usable
+        second = self.collector.load_all_executions()[0]
+        assert second.metrics[1].labels is not first.metrics[1].labels
+        assert first.model_copy(deep=True).metrics[1].labels == {"method": "requests"}
+        assert json.loads(first.model_dump_json())["metrics"][1]["labels"] == {"method": "requests"}
+
+    def test_save_metrics_table(self):
+        """Test round-tripping raw metric rows through Parquet"""
+        pytest.importorskip("pyarrow")
+        executions = [
+            self.create_mock_execution("exec1"),
+            self.create_mock_execution("exec2")
+        ]
+
+        filepath = self.collector.save_metrics_table(executions)
+        assert filepath.exists()
+
+        df = self.collector.load_metrics_table(names=["scrape.success"])
+        assert len(df) == 2
+        assert set(df["execution_id"]) == {"exec1", "exec2"}
+        assert df["value"].sum() == 16
+
 
 class TestErrorAnalyzer:
     """Test the ErrorAnalyzer class"""
@@ -274,6 +494,37 @@ class TestErrorAnalyzer:
         
         # Unknown errors
         assert self.analyzer.categorize_error_message("Something weird happened") == ErrorCategory.UNKNOWN_ERROR
+
+    def test_categorize_error_message_cached(self):
+        """Test that repeated messages are served from the category cache"""
+        self.analyzer.clear_category_cache()
+        
+        assert self.analyzer.categorize_error_message("Rate limit exceeded") == ErrorCategory.RATE_LIMIT
+        assert self.analyzer.categorize_error_message("  RATE LIMIT EXCEEDED ") == ErrorCategory.RATE_LIMIT
+        
+        info = self.analyzer._categorize_cached.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+    
+    @pytest.mark.parametrize("automaton", ["fake", "pyahocorasick"])
+    def test_categorize_error_message_automaton(self, automaton, monkeypatch):
+        """Test the keyword-automaton path, including edits to error_patterns"""
+        if automaton == "fake":
+            monkeypatch.setattr(error_analyzer, "ahocorasick", _FakeAhoCorasick, raising=False)
+        else:
+            monkeypatch.setattr(error_analyzer, "ahocorasick", pytest.importorskip("ahocorasick"), raising=False)
+        monkeypatch.setattr(error_analyzer, "AHOCORASICK_AVAILABLE", True)
+        analyzer = ErrorAnalyzer()
+        assert analyzer._keyword_automaton is not None
+        
+        # "bot" (bot detection) outranks "timeout" (network) by category order
+        assert analyzer.categorize_error_message("Bot check timeout") == ErrorCategory.BOT_DETECTION
+        assert analyzer.categorize_error_message("Connection timeout") == ErrorCategory.NETWORK_ERROR
+        assert analyzer.categorize_error_message("Something weird happened") == ErrorCategory.UNKNOWN_ERROR
+        
+        analyzer.error_patterns[ErrorCategory.FIRECRAWL_ERROR].append("weird")
+        analyzer.clear_category_cache()
+        assert analyzer.categorize_error_message("Something weird happened") == ErrorCategory.FIRECRAWL_ERROR
     
     def test_analyze_errors_empty(self):
         """Test analyzing empty error list"""
@@ -319,6 +570,12 @@ class TestErrorAnalyzer:
         assert len(suggestions) > 0
         assert any("Firecrawl" in suggestion for suggestion in suggestions)
         assert any("headers" in suggestion for suggestion in suggestions)
+        
+        # Each call returns a new list that callers may extend
+        suggestions.append("Retry later")
+        assert self.analyzer.get_error_resolution_suggestions(bot_error) == suggestions[:-1]
+        unknown_error = self.create_mock_error(ErrorCategory.UNKNOWN_ERROR, "Something weird")
+        assert self.analyzer.get_error_resolution_suggestions(unknown_error) == []
     
     def test_generate_error_report(self):
         """Test generating error report"""
@@ -344,13 +601,13 @@ class TestErrorAnalyzer:
 
 # Fixtures for pytest
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path):
     """Provide a temporary directory for tests"""
-    import tempfile
-    return tempfile.mkdtemp()
+    return str(tmp_path)
 
 
-@pytest.fixture
+# Scrape results are only read by the monitor, so one instance serves every test
+@pytest.fixture(scope="session")
 def mock_scrape_result():
     """Provide a mock scrape result"""
     return ScrapeResult(
@@ -363,11 +620,26 @@ def mock_scrape_result():
     )
 
 
+@pytest.fixture(scope="session")
+def bot_scrape_result():
+    """Provide a mock scrape result blocked by bot detection"""
+    return ScrapeResult(
+        success=False,
+        url="https://example.com",
+        status_code=403,
+        content=None,
+        final_url="https://example.com",
+        final_method=ScrapingMethod.REQUESTS,
+        error_reason="Bot detected",
+        page_issues=[PageIssue.BOT_DETECTED]
+    )
+
+
 # Integration tests
 class TestMonitoringIntegration:
     """Integration tests for monitoring components"""
     
-    def test_full_pipeline_monitoring(self, temp_dir):
+    def test_full_pipeline_monitoring(self, temp_dir, mock_scrape_result, bot_scrape_result):
         """Test full pipeline monitoring workflow"""
         monitor = PipelineMonitor(metrics_dir=temp_dir)
         
@@ -375,28 +647,10 @@ class TestMonitoringIntegration:
         execution_id = monitor.start_execution(total_urls=2)
         
         # Record successful scrape
-        success_result = ScrapeResult(
-            success=True,
-            url="https://example.com/1",
-            status_code=200,
-            content="<html>Content 1</html>",
-            final_url="https://example.com/1",
-            final_method=ScrapingMethod.REQUESTS
-        )
-        monitor.record_scrape_result(success_result)
+        monitor.record_scrape_result(mock_scrape_result)
         
         # Record failed scrape
-        fail_result = ScrapeResult(
-            success=False,
-            url="https://example.com/2",
-            status_code=403,
-            content=None,
-            final_url="https://example.com/2",
-            final_method=ScrapingMethod.REQUESTS,
-            error_reason="Bot detected",
-            page_issues=[PageIssue.BOT_DETECTED]
-        )
-        monitor.record_scrape_result(fail_result)
+        monitor.record_scrape_result(bot_scrape_result)
         
         # Record LLM results
         monitor.record_llm_result(success=True, model="gpt-4o-mini", tokens_used=500, cost=0.001)